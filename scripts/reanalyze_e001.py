@@ -16,7 +16,7 @@ import numpy as np
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from session_analysis import analyze_session
+from session_analysis import analyze_sessions
 
 # E001 pairs from results.json
 E001_PAIRS = [
@@ -46,12 +46,10 @@ def analyze_pair(pair_id: str, provocation: str) -> dict:
         print(f"  Warning: Missing sessions for pair {pair_id}")
         return None
 
-    # Analyze both
+    # Analyze both (one embedding batch, shared prefix cache)
     print(f"\n  Analyzing single-model: {single_sessions[0].name}")
-    single_result = analyze_session(single_sessions[0])
-
     print(f"  Analyzing multi-model: {multi_sessions[0].name}")
-    multi_result = analyze_session(multi_sessions[0])
+    single_result, multi_result = analyze_sessions([single_sessions[0], multi_sessions[0]])
 
     return {
         "pair_id": pair_id,
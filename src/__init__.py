@@ -40,7 +40,8 @@ from .metrics import (
     entropy_shift,
     semantic_velocity,
     compute_metrics,
-    compute_metrics_from_session
+    compute_metrics_from_session,
+    StreamingMetrics
 )
 from .experiment import (
     ExperimentRunner,
@@ -90,6 +91,7 @@ __all__ = [
     "semantic_velocity",
     "compute_metrics",
     "compute_metrics_from_session",
+    "StreamingMetrics",
     # Experiments
     "ExperimentRunner",
     "PairResult",
@@ -0,0 +1,124 @@
+"""
+Numeric kernels for per-turn session analysis.
+
+Copyright (c) 2025 Mathew Mark Mytka
+SPDX-License-Identifier: LicenseRef-ESL-A
+
+Licensed under the Earthian Stewardship License (ESL-A).
+See LICENSE file for full terms.
+
+Small array-in, tuple-out functions for the work SessionAnalyzer does on
+every turn. They are compiled with numba when it is installed; otherwise
+the same code runs as ordinary NumPy. Callers in metrics.py and
+session_analysis.py keep their dict-based interfaces and unpack these
+results.
+
+Kernels return NaN where the Python API returns None.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback when numba is not installed: return the function as-is."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# =============================================================================
+# Embedding trajectory step
+# =============================================================================
+
+@njit(cache=True)
+def embedding_step(
+    prev: np.ndarray,
+    prev_norm: float,
+    prev_step: np.ndarray,
+    has_prev_step: bool,
+    embedding: np.ndarray
+) -> Tuple[float, np.ndarray, float, float]:
+    """
+    Per-turn update for the semantic trajectory of embeddings.
+
+    Matches semantic_velocity() and semantic_curvature() in metrics.py for
+    one new point.
+
+    Args:
+        prev: Previous embedding
+        prev_norm: ||prev||
+        prev_step: Previous difference vector (prev - the one before)
+        has_prev_step: Whether prev_step is valid
+        embedding: New embedding
+
+    Returns:
+        Tuple of (||embedding||, new step vector, cosine velocity,
+        local curvature at the previous step or NaN if not yet defined)
+    """
+    norm = np.sqrt(np.dot(embedding, embedding))
+
+    if prev_norm == 0 or norm == 0:
+        velocity = 1.0
+    else:
+        velocity = 1.0 - np.dot(prev, embedding) / (prev_norm * norm)
+
+    step = embedding - prev
+    curvature = np.nan
+    if has_prev_step:
+        a = step - prev_step
+        v_norm = np.sqrt(np.dot(prev_step, prev_step))
+        if v_norm < 1e-10:
+            curvature = 0.0
+        else:
+            v_hat = prev_step / v_norm
+            a_perp = a - np.dot(a, v_hat) * v_hat
+            curvature = np.sqrt(np.dot(a_perp, a_perp)) / (v_norm ** 2)
+
+    return norm, step, velocity, curvature
+
+
+# =============================================================================
+# Ψ trajectory derivatives
+# =============================================================================
+
+@njit(cache=True)
+def psi_derivatives(psi: np.ndarray, t: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Speed, acceleration magnitude and curvature from the last three Ψ points.
+
+    Matches TrajectoryBuffer.compute_velocity_magnitude(),
+    compute_acceleration_magnitude() and compute_curvature() when every
+    substrate is present.
+
+    Args:
+        psi: Array of shape (3, n_substrates), oldest point first
+        t: Timestamps of the three points
+
+    Returns:
+        Tuple of (speed, acceleration magnitude, curvature), NaN where
+        undefined
+    """
+    dt = t[2] - t[0]
+    if dt == 0:
+        return np.nan, np.nan, np.nan
+
+    v = (psi[2] - psi[0]) / dt
+    half_dt = dt / 2
+    a = (psi[2] - 2 * psi[1] + psi[0]) / (half_dt ** 2)
+
+    speed = np.sqrt(np.dot(v, v))
+    accel = np.sqrt(np.dot(a, a))
+
+    if speed < 1e-10:
+        return speed, accel, np.nan
+
+    cross_sq = speed ** 2 * accel ** 2 - np.dot(v, a) ** 2
+    curvature = np.sqrt(max(0.0, cross_sq)) / (speed ** 3)
+    return speed, accel, curvature
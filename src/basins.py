@@ -34,6 +34,7 @@ __all__ = [
     'BasinHistory',
     'BasinDetector',
     'DialogueContext',
+    'DialogueState',
     'compute_psi_vector',
     'compute_affective_substrate',
     'compute_dialogue_context',
@@ -64,6 +65,21 @@ class DialogueContext:
         return asdict(self)
 
 
+# Canonical basin labels, in taxonomy order; their index is the code
+# BasinHistory stores
+_BASIN_LABELS = (
+    'Deep Resonance',
+    'Collaborative Inquiry',
+    'Cognitive Mimicry',
+    'Reflexive Performance',
+    'Sycophantic Convergence',
+    'Creative Dilation',
+    'Generative Conflict',
+    'Dissociation',
+    'Transitional'
+)
+
+
 class BasinHistory:
     """
     Tracks basin sequence for hysteresis-aware detection.
@@ -72,20 +88,63 @@ class BasinHistory:
     - Residence time computation
     - Transition counting
     - Basin sequence analysis
+
+    Basins are stored as small-int codes (the taxonomy index for canonical
+    labels; other labels get codes after them) in a preallocated array, so
+    distributions are a single bincount. Labels are returned as strings.
     """
 
     def __init__(self, max_history: int = 100):
         self.max_history = max_history
-        self.history: List[Tuple[int, str, float]] = []  # (turn, basin, confidence)
+
+        # Twice max_history so the window only moves back to the front
+        # once every max_history appends
+        capacity = 2 * max(max_history, 1)
+        self._turns = np.empty(capacity, dtype=np.int64)
+        self._codes = np.empty(capacity, dtype=np.int16)
+        self._confidences = np.empty(capacity, dtype=np.float64)
+        self._start = 0
+        self._end = 0
+
+        self._labels: List[str] = list(_BASIN_LABELS)
+        self._label_codes: Dict[str, int] = {label: i for i, label in enumerate(_BASIN_LABELS)}
+
         self._current_basin: Optional[str] = None
         self._previous_basin: Optional[str] = None
         self._basin_entry_turn: int = 0
         self._transition_count: int = 0
+        self._residence: int = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def _code(self, basin: str) -> int:
+        code = self._label_codes.get(basin)
+        if code is None:
+            code = self._label_codes[basin] = len(self._labels)
+            self._labels.append(basin)
+        return code
+
+    def _codes_view(self) -> np.ndarray:
+        return self._codes[self._start:self._end]
+
+    @property
+    def history(self) -> List[Tuple[int, str, float]]:
+        """Retained (turn, basin, confidence) entries, oldest first."""
+        sl = slice(self._start, self._end)
+        return [
+            (turn, self._labels[code], confidence)
+            for turn, code, confidence in zip(
+                self._turns[sl].tolist(),
+                self._codes[sl].tolist(),
+                self._confidences[sl].tolist()
+            )
+        ]
 
     def append(self, basin: str, confidence: float, turn: int = None) -> None:
         """Add a basin entry to history."""
         if turn is None:
-            turn = len(self.history)
+            turn = len(self)
 
         if self._current_basin is not None and basin != self._current_basin:
             self._previous_basin = self._current_basin
@@ -95,28 +154,34 @@ class BasinHistory:
         if self._current_basin is None:
             self._basin_entry_turn = turn
 
+        self._residence = self._residence + 1 if basin == self._current_basin else 1
         self._current_basin = basin
-        self.history.append((turn, basin, confidence))
 
-        if len(self.history) > self.max_history:
-            self.history = self.history[-self.max_history:]
+        if self._end == len(self._codes):
+            keep = self.max_history - 1
+            if keep > 0:
+                for arr in (self._turns, self._codes, self._confidences):
+                    arr[:keep] = arr[self._end - keep:self._end]
+            else:
+                keep = 0
+            self._start = 0
+            self._end = keep
+
+        i = self._end
+        self._turns[i] = turn
+        self._codes[i] = self._code(basin)
+        self._confidences[i] = confidence
+        self._end += 1
+
+        if self._end - self._start > self.max_history:
+            self._start = self._end - self.max_history
 
     def get_current_basin(self) -> Optional[str]:
         return self._current_basin
 
     def get_residence_time(self) -> int:
         """Consecutive turns in current basin."""
-        if not self.history:
-            return 0
-
-        current = self._current_basin
-        count = 0
-        for _, basin, _ in reversed(self.history):
-            if basin == current:
-                count += 1
-            else:
-                break
-        return count
+        return min(self._residence, len(self))
 
     def get_previous_basin(self) -> Optional[str]:
         return self._previous_basin
@@ -126,33 +191,41 @@ class BasinHistory:
 
     def get_basin_sequence(self, n: int = None) -> List[str]:
         """Get sequence of recent basins."""
-        if n is None:
-            return [basin for _, basin, _ in self.history]
-        return [basin for _, basin, _ in self.history[-n:]]
+        codes = self._codes_view()
+        if n is not None:
+            codes = codes[-n:]
+        labels = self._labels
+        return [labels[code] for code in codes.tolist()]
 
     def get_basin_distribution(self) -> Dict[str, int]:
-        """Count visits to each basin."""
-        dist = defaultdict(int)
-        for _, basin, _ in self.history:
-            dist[basin] += 1
-        return dict(dist)
+        """Count visits to each basin (in order of first visit)."""
+        codes = self._codes_view()
+        if len(codes) == 0:
+            return {}
+        counts = np.bincount(codes, minlength=len(self._labels))
+        present, first_seen = np.unique(codes, return_index=True)
+        return {
+            self._labels[code]: int(counts[code])
+            for code in present[np.argsort(first_seen)].tolist()
+        }
 
     def get_transition_matrix(self) -> Dict[Tuple[str, str], int]:
         """Count transitions between basins."""
+        codes = self._codes_view()
+        changed = np.flatnonzero(codes[1:] != codes[:-1])
         matrix = defaultdict(int)
-        for i in range(1, len(self.history)):
-            prev_basin = self.history[i-1][1]
-            curr_basin = self.history[i][1]
-            if prev_basin != curr_basin:
-                matrix[(prev_basin, curr_basin)] += 1
+        for prev_code, curr_code in zip(codes[changed].tolist(), codes[changed + 1].tolist()):
+            matrix[(self._labels[prev_code], self._labels[curr_code])] += 1
         return dict(matrix)
 
     def clear(self) -> None:
-        self.history = []
+        self._start = 0
+        self._end = 0
         self._current_basin = None
         self._previous_basin = None
         self._basin_entry_turn = 0
         self._transition_count = 0
+        self._residence = 0
 
 
 class BasinDetector:
@@ -166,17 +239,7 @@ class BasinDetector:
     """
 
     # Canonical basins for multi-agent dialogue
-    BASINS = [
-        'Deep Resonance',
-        'Collaborative Inquiry',
-        'Cognitive Mimicry',
-        'Reflexive Performance',
-        'Sycophantic Convergence',
-        'Creative Dilation',
-        'Generative Conflict',
-        'Dissociation',
-        'Transitional'
-    ]
+    BASINS = list(_BASIN_LABELS)
 
     def __init__(
         self,
@@ -368,6 +431,66 @@ class BasinDetector:
             return ("Transitional", 0.3)
 
 
+# Hedging patterns (uncertainty markers)
+HEDGING_PATTERNS = [
+    r'\b(I think|I guess|maybe|perhaps|possibly|probably|might|could be|seems like|sort of|kind of)\b',
+    r'\b(I\'m not sure|I wonder|I feel like|it appears|it seems)\b',
+    r'\b(arguably|presumably|apparently|seemingly)\b'
+]
+
+# Vulnerability/openness indicators
+VULNERABILITY_PATTERNS = [
+    r'\b(I feel|I\'m feeling|I felt)\b',
+    r'\b(honestly|to be honest|truthfully)\b',
+    r'\b(I don\'t know|I\'m not sure|I\'m uncertain)\b'
+]
+
+
+def _count_patterns(text: str, patterns: List[str]) -> int:
+    """Count case-insensitive matches of all patterns in text."""
+    return sum(len(re.findall(pattern, text, re.IGNORECASE)) for pattern in patterns)
+
+
+def _affective_result(
+    sentiment_scores: List[float],
+    total_words: int,
+    hedging_count: int,
+    vulnerability_count: int
+) -> dict:
+    """Combine per-turn affective counts into the psi_affective result dict."""
+    sentiment_variance = float(np.var(sentiment_scores)) if len(sentiment_scores) > 1 else 0.0
+    hedging_density = float(hedging_count / max(total_words, 1))
+    vulnerability_score = float(vulnerability_count / max(total_words, 1))
+
+    # Composite psi_affective
+    sentiment_norm = min(sentiment_variance / 0.5, 1.0)
+    hedging_norm = min(hedging_density / 0.1, 1.0)
+    vulnerability_norm = min(vulnerability_score / 0.05, 1.0)
+
+    psi_affective_raw = (
+        0.4 * sentiment_norm +
+        0.3 * hedging_norm +
+        0.3 * vulnerability_norm
+    )
+    psi_affective = np.tanh(2 * (psi_affective_raw - 0.5))
+
+    return {
+        'psi_affective': float(psi_affective),
+        'sentiment_trajectory': sentiment_scores,
+        'hedging_density': float(hedging_density),
+        'vulnerability_score': float(vulnerability_score)
+    }
+
+
+def _empty_affective_result() -> dict:
+    return {
+        'psi_affective': 0.0,
+        'sentiment_trajectory': [],
+        'hedging_density': 0.0,
+        'vulnerability_score': 0.0
+    }
+
+
 def compute_affective_substrate(turn_texts: List[str]) -> dict:
     """
     Calculate psi_affective from dialogue turn texts using VADER.
@@ -380,20 +503,13 @@ def compute_affective_substrate(turn_texts: List[str]) -> dict:
     Returns:
         dict with psi_affective, hedging_density, sentiment_trajectory
     """
-    empty_result = {
-        'psi_affective': 0.0,
-        'sentiment_trajectory': [],
-        'hedging_density': 0.0,
-        'vulnerability_score': 0.0
-    }
-
     try:
         from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
     except ImportError:
-        return empty_result
+        return _empty_affective_result()
 
     if not turn_texts:
-        return empty_result
+        return _empty_affective_result()
 
     vader = SentimentIntensityAnalyzer()
 
@@ -403,63 +519,22 @@ def compute_affective_substrate(turn_texts: List[str]) -> dict:
         scores = vader.polarity_scores(text)
         sentiment_scores.append(scores['compound'])
 
-    sentiment_variance = float(np.var(sentiment_scores)) if len(sentiment_scores) > 1 else 0.0
-
-    # Hedging patterns (uncertainty markers)
-    hedging_patterns = [
-        r'\b(I think|I guess|maybe|perhaps|possibly|probably|might|could be|seems like|sort of|kind of)\b',
-        r'\b(I\'m not sure|I wonder|I feel like|it appears|it seems)\b',
-        r'\b(arguably|presumably|apparently|seemingly)\b'
-    ]
-
     total_words = 0
     hedging_count = 0
-    for text in turn_texts:
-        words = text.split()
-        total_words += len(words)
-        for pattern in hedging_patterns:
-            hedging_count += len(re.findall(pattern, text, re.IGNORECASE))
-
-    hedging_density = float(hedging_count / max(total_words, 1))
-
-    # Vulnerability/openness indicators
-    vulnerability_patterns = [
-        r'\b(I feel|I\'m feeling|I felt)\b',
-        r'\b(honestly|to be honest|truthfully)\b',
-        r'\b(I don\'t know|I\'m not sure|I\'m uncertain)\b'
-    ]
-
     vulnerability_count = 0
     for text in turn_texts:
-        for pattern in vulnerability_patterns:
-            vulnerability_count += len(re.findall(pattern, text, re.IGNORECASE))
+        total_words += len(text.split())
+        hedging_count += _count_patterns(text, HEDGING_PATTERNS)
+        vulnerability_count += _count_patterns(text, VULNERABILITY_PATTERNS)
 
-    vulnerability_score = float(vulnerability_count / max(total_words, 1))
-
-    # Composite psi_affective
-    sentiment_norm = min(sentiment_variance / 0.5, 1.0)
-    hedging_norm = min(hedging_density / 0.1, 1.0)
-    vulnerability_norm = min(vulnerability_score / 0.05, 1.0)
-
-    psi_affective_raw = (
-        0.4 * sentiment_norm +
-        0.3 * hedging_norm +
-        0.3 * vulnerability_norm
-    )
-    psi_affective = np.tanh(2 * (psi_affective_raw - 0.5))
-
-    return {
-        'psi_affective': float(psi_affective),
-        'sentiment_trajectory': sentiment_scores,
-        'hedging_density': float(hedging_density),
-        'vulnerability_score': float(vulnerability_score)
-    }
+    return _affective_result(sentiment_scores, total_words, hedging_count, vulnerability_count)
 
 
 def compute_psi_vector(
     metrics: dict,
     turn_texts: List[str] = None,
-    window_metrics: List[dict] = None
+    window_metrics: List[dict] = None,
+    affective: dict = None
 ) -> dict:
     """
     Compute Psi vector from metrics and turn texts.
@@ -468,6 +543,8 @@ def compute_psi_vector(
         metrics: Dict with delta_kappa, delta_h (or entropy_shift), alpha (or dfa_alpha)
         turn_texts: List of turn content strings for affective analysis
         window_metrics: List of per-window metrics for temporal stability
+        affective: Precomputed compute_affective_substrate() result for
+            turn_texts (e.g. from DialogueState); skips the text pass
 
     Returns:
         dict with psi_semantic, psi_temporal, psi_affective
@@ -498,7 +575,10 @@ def compute_psi_vector(
     # Psi_affective from text analysis
     psi_affective = 0.0
     hedging_density = 0.0
-    if turn_texts:
+    if affective is not None:
+        psi_affective = affective['psi_affective']
+        hedging_density = affective['hedging_density']
+    elif turn_texts:
         affective_result = compute_affective_substrate(turn_texts)
         psi_affective = affective_result['psi_affective']
         hedging_density = affective_result['hedging_density']
@@ -516,6 +596,45 @@ def compute_psi_vector(
     }
 
 
+def _delta_kappa_variance(window_metrics: Optional[List[dict]]) -> float:
+    """Variance of per-window delta_kappa, 0.0 with fewer than two windows."""
+    if window_metrics and len(window_metrics) >= 2:
+        dk_values = [
+            m.get('delta_kappa', 0) or m.get('semantic_curvature', 0)
+            for m in window_metrics if m
+        ]
+        if len(dk_values) >= 2:
+            return float(np.var(dk_values))
+    return 0.0
+
+
+def _voice_distinctiveness(centroids: List[np.ndarray]) -> float:
+    """Average pairwise cosine distance between agent centroid embeddings."""
+    distances = []
+    for i in range(len(centroids)):
+        for j in range(i + 1, len(centroids)):
+            d = 1 - np.dot(centroids[i], centroids[j]) / (
+                np.linalg.norm(centroids[i]) * np.linalg.norm(centroids[j]) + 1e-10
+            )
+            distances.append(d)
+    return float(np.mean(distances)) if distances else 0.0
+
+
+def _coherence_pattern(velocity: np.ndarray) -> str:
+    """Classify coherence from the lag-1 autocorrelation of semantic velocity."""
+    autocorr = np.corrcoef(velocity[:-1], velocity[1:])[0, 1]
+    if np.isnan(autocorr):
+        return 'transitional'
+    elif autocorr < -0.2:
+        return 'breathing'  # Negative autocorr = explore/consolidate rhythm
+    elif autocorr > 0.3:
+        return 'locked'  # Positive autocorr = stuck
+    elif np.var(velocity) > 0.1:
+        return 'fragmented'  # High variance = chaotic
+    else:
+        return 'transitional'
+
+
 def compute_dialogue_context(
     turn_texts: List[str],
     turn_agents: List[str],
@@ -554,13 +673,7 @@ def compute_dialogue_context(
             ctx.turn_length_variance = float(np.var(agent_means))
 
     # Delta kappa variance (trajectory responsiveness)
-    if window_metrics and len(window_metrics) >= 2:
-        dk_values = [
-            m.get('delta_kappa', 0) or m.get('semantic_curvature', 0)
-            for m in window_metrics if m
-        ]
-        if len(dk_values) >= 2:
-            ctx.delta_kappa_variance = float(np.var(dk_values))
+    ctx.delta_kappa_variance = _delta_kappa_variance(window_metrics)
 
     # Voice distinctiveness from embeddings
     if embeddings is not None and turn_agents and len(embeddings) == len(turn_agents):
@@ -578,15 +691,9 @@ def compute_dialogue_context(
 
             # Average pairwise distance between agent centroids
             if len(agent_centroids) >= 2:
-                centroids = list(agent_centroids.values())
-                distances = []
-                for i in range(len(centroids)):
-                    for j in range(i + 1, len(centroids)):
-                        d = 1 - np.dot(centroids[i], centroids[j]) / (
-                            np.linalg.norm(centroids[i]) * np.linalg.norm(centroids[j]) + 1e-10
-                        )
-                        distances.append(d)
-                ctx.voice_distinctiveness = float(np.mean(distances)) if distances else 0.0
+                ctx.voice_distinctiveness = _voice_distinctiveness(
+                    list(agent_centroids.values())
+                )
 
     # Coherence pattern from autocorrelation of semantic velocity
     if embeddings is not None and len(embeddings) >= 6:
@@ -596,22 +703,164 @@ def compute_dialogue_context(
             from metrics import semantic_velocity
         velocity = semantic_velocity(embeddings)
         if len(velocity) >= 5:
-            # Autocorrelation at lag 1
-            autocorr = np.corrcoef(velocity[:-1], velocity[1:])[0, 1]
-            if np.isnan(autocorr):
-                ctx.coherence_pattern = 'transitional'
-            elif autocorr < -0.2:
-                ctx.coherence_pattern = 'breathing'  # Negative autocorr = explore/consolidate rhythm
-            elif autocorr > 0.3:
-                ctx.coherence_pattern = 'locked'  # Positive autocorr = stuck
-            elif np.var(velocity) > 0.1:
-                ctx.coherence_pattern = 'fragmented'  # High variance = chaotic
-            else:
-                ctx.coherence_pattern = 'transitional'
+            ctx.coherence_pattern = _coherence_pattern(velocity)
 
     return ctx
 
 
+# =============================================================================
+# Incremental Dialogue State
+# =============================================================================
+
+class DialogueState:
+    """
+    Running per-turn state behind compute_affective_substrate() and
+    compute_dialogue_context().
+
+    Each turn is scored once when it arrives (VADER, pattern counts, word
+    counts, per-agent centroid sums, velocity from the previous embedding),
+    so a live session does not re-read every earlier turn on every call.
+    Results match the batch functions, except that agent centroids are
+    accumulated in float64 rather than averaged in the embedding dtype.
+
+    Usage:
+        state = DialogueState()
+        state.update(text, agent, embedding)
+        psi = compute_psi_vector(metrics, affective=state.affective())
+        ctx = state.context(window_metrics)
+    """
+
+    def __init__(self):
+        try:
+            from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+            self._vader = SentimentIntensityAnalyzer()
+        except ImportError:
+            self._vader = None
+        self.clear()
+
+    def clear(self) -> None:
+        """Forget all turns."""
+        self.n_turns = 0
+        self._sentiment_scores: List[float] = []
+        self._total_words = 0
+        self._hedging_count = 0
+        self._vulnerability_count = 0
+
+        # agent -> [word count sum, turns]; agent -> [embedding sum, count]
+        self._agent_words: Dict[str, List[int]] = {}
+        self._agent_embeddings: Dict[str, list] = {}
+
+        self.n_embeddings = 0
+        self._prev_embedding: Optional[np.ndarray] = None
+        self._prev_norm = 0.0
+        self._velocities: list = []
+
+    def update(
+        self,
+        text: str,
+        agent: str,
+        embedding: np.ndarray = None,
+        norm: float = None,
+        velocity: float = None
+    ) -> None:
+        """
+        Add one turn.
+
+        Args:
+            text: Turn content
+            agent: Agent ID
+            embedding: Optional embedding vector for the turn
+            norm: ||embedding||, if the caller already has it
+            velocity: Cosine distance from the previous embedding, if the
+                caller already has it (e.g. StreamingMetrics.last_velocity)
+        """
+        self.n_turns += 1
+        word_count = len(text.split())
+        self._total_words += word_count
+        if self._vader is not None:
+            self._sentiment_scores.append(self._vader.polarity_scores(text)['compound'])
+            self._hedging_count += _count_patterns(text, HEDGING_PATTERNS)
+            self._vulnerability_count += _count_patterns(text, VULNERABILITY_PATTERNS)
+
+        words = self._agent_words.setdefault(agent, [0, 0])
+        words[0] += word_count
+        words[1] += 1
+
+        if embedding is None:
+            return
+
+        if norm is None:
+            norm = np.linalg.norm(embedding)
+        if self._prev_embedding is not None and velocity is not None:
+            self._velocities.append(velocity)
+        elif self._prev_embedding is not None:
+            # Same expression as semantic_velocity() in metrics.py
+            if self._prev_norm == 0 or norm == 0:
+                self._velocities.append(1.0)
+            else:
+                sim = np.dot(self._prev_embedding, embedding) / (self._prev_norm * norm)
+                self._velocities.append(1.0 - sim)
+        self._prev_embedding = embedding
+        self._prev_norm = norm
+        self.n_embeddings += 1
+
+        acc = self._agent_embeddings.get(agent)
+        if acc is None:
+            self._agent_embeddings[agent] = [np.array(embedding, dtype=np.float64), 1]
+        else:
+            acc[0] += embedding
+            acc[1] += 1
+
+    def affective(self) -> dict:
+        """Equivalent of compute_affective_substrate() over all turns so far."""
+        if self._vader is None or not self.n_turns:
+            return _empty_affective_result()
+        return _affective_result(
+            list(self._sentiment_scores),
+            self._total_words,
+            self._hedging_count,
+            self._vulnerability_count
+        )
+
+    def context(self, window_metrics: List[dict] = None) -> DialogueContext:
+        """
+        Equivalent of compute_dialogue_context() over all turns so far.
+
+        Voice distinctiveness needs an embedding for every turn and coherence
+        pattern at least six embeddings, as in the batch function.
+
+        Args:
+            window_metrics: List of per-window metric dicts
+
+        Returns:
+            DialogueContext with features for basin classification
+        """
+        ctx = DialogueContext()
+        if not self.n_turns:
+            return ctx
+
+        ctx.hedging_density = self.affective()['hedging_density']
+
+        if len(self._agent_words) >= 2:
+            agent_means = [total / count for total, count in self._agent_words.values()]
+            ctx.turn_length_variance = float(np.var(agent_means))
+
+        ctx.delta_kappa_variance = _delta_kappa_variance(window_metrics)
+
+        if (self.n_embeddings >= 2 and self.n_embeddings == self.n_turns
+                and len(self._agent_embeddings) >= 2):
+            dtype = self._prev_embedding.dtype
+            ctx.voice_distinctiveness = _voice_distinctiveness([
+                (total / count).astype(dtype, copy=False)
+                for total, count in self._agent_embeddings.values()
+            ])
+
+        if self.n_embeddings >= 6:
+            ctx.coherence_pattern = _coherence_pattern(np.array(self._velocities))
+
+        return ctx
+
+
 # Test if run directly
 if __name__ == "__main__":
     print("Basin Detection Module Test")
@@ -20,6 +20,7 @@ which undermines curvature and DFA measurements.
 """
 
 import numpy as np
+from functools import lru_cache
 from typing import List, Optional, Union
 
 
@@ -69,19 +70,29 @@ class EmbeddingService:
         self._ensure_loaded()
         return self._model.encode(text)
 
-    def embed_batch(self, texts: List[str], show_progress: bool = False) -> np.ndarray:
+    def embed_batch(
+        self,
+        texts: List[str],
+        show_progress: bool = False,
+        batch_size: int = 32
+    ) -> np.ndarray:
         """
         Generate embeddings for multiple texts.
 
         Args:
             texts: List of input texts
             show_progress: Show progress bar for large batches
+            batch_size: Texts per forward pass
 
         Returns:
             Array of embedding vectors (shape: len(texts), dimensions)
         """
         self._ensure_loaded()
-        return self._model.encode(texts, show_progress_bar=show_progress)
+        return self._model.encode(
+            texts,
+            batch_size=batch_size,
+            show_progress_bar=show_progress
+        )
 
     def semantic_distance(
         self,
@@ -129,20 +140,21 @@ class EmbeddingService:
         return np.array(velocities)
 
 
-# Singleton for convenience
-_default_service: Optional[EmbeddingService] = None
+# One shared service per model name per process
+@lru_cache(maxsize=None)
+def _shared_service(model_name: str) -> EmbeddingService:
+    return EmbeddingService(model_name)
 
 
 def get_embedding_service(model_name: str = "all-mpnet-base-v2") -> EmbeddingService:
     """
-    Get or create a default embedding service.
+    Get or create the shared embedding service for a model.
 
-    Uses singleton pattern to avoid reloading model.
+    Each model is loaded at most once per process, so alternating between
+    models does not reload either, and worker processes forked after the
+    model is loaded inherit it rather than loading their own.
     """
-    global _default_service
-    if _default_service is None or _default_service.model_name != model_name:
-        _default_service = EmbeddingService(model_name)
-    return _default_service
+    return _shared_service(model_name)
 
 
 def embed(text: Union[str, List[str]]) -> np.ndarray:
@@ -150,7 +150,7 @@ class IntegrityAnalyzer:
             IntegrityResult with all computed metrics
         """
         # Handle None or empty trajectory
-        if trajectory is None or len(trajectory.history) < self.min_length:
+        if trajectory is None or len(trajectory) < self.min_length:
             return IntegrityResult(
                 autocorrelation=None,
                 tortuosity=None,
@@ -250,24 +250,16 @@ class IntegrityAnalyzer:
         Returns:
             float: Recurrence rate [0, 1]
         """
-        if len(trajectory.history) < 3:
+        if len(trajectory) < 3:
             return 0.0
 
-        # Extract trajectory as array
-        traj_points = []
-        for _, psi in trajectory.history:
-            vals = []
-            for key in self.SUBSTRATES:
-                v = psi.get(key)
-                if v is not None:
-                    vals.append(v)
-            if vals:
-                traj_points.append(vals)
-
-        if len(traj_points) < 3:
+        # Points with every substrate present
+        traj_arr = trajectory.psi_array
+        traj_arr = traj_arr[~np.isnan(traj_arr).any(axis=1)]
+
+        if len(traj_arr) < 3:
             return 0.0
 
-        traj_arr = np.array(traj_points)
         n_points = len(traj_arr)
         threshold = 0.1  # Distance threshold for "nearby"
 
@@ -439,15 +431,16 @@ class TransformationDetector:
         Returns:
             float: Transformation density [0, 1]
         """
-        if trajectory is None or len(trajectory.history) < 2:
+        if trajectory is None or len(trajectory) < 2:
             return 0.0
 
         transformations = 0
-        basin_sequence = basin_history.get_basin_sequence() if basin_history else [None] * len(trajectory.history)
+        history = trajectory.history
+        basin_sequence = basin_history.get_basin_sequence() if basin_history else [None] * len(history)
 
-        for i in range(1, len(trajectory.history)):
-            _, psi_prev = trajectory.history[i - 1]
-            _, psi_curr = trajectory.history[i]
+        for i in range(1, len(history)):
+            _, psi_prev = history[i - 1]
+            _, psi_curr = history[i]
 
             basin_prev = basin_sequence[i - 1] if i - 1 < len(basin_sequence) else None
             basin_curr = basin_sequence[i] if i < len(basin_sequence) else None
@@ -456,7 +449,7 @@ class TransformationDetector:
                 transformations += 1
 
         # Normalize by number of steps
-        n_steps = len(trajectory.history) - 1
+        n_steps = len(history) - 1
         density = transformations / n_steps if n_steps > 0 else 0.0
 
         return float(np.clip(density, 0, 1))
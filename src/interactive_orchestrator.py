@@ -654,11 +654,14 @@ class InteractiveSession:
         self._started = True
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Initialize live metrics analyzer
-        self._live_analyzer = SessionAnalyzer()
+        # Initialize live metrics analyzer. The live view refreshes DFA and
+        # entropy every few turns; the saved analysis recomputes them exactly.
+        self._live_analyzer = SessionAnalyzer(metrics_refresh_interval=4)
 
         # Initialize logger with our pre-generated session_id
-        self.logger = SessionLogger(self.output_dir, session_id=self.session_id)
+        self.logger = SessionLogger(
+            self.output_dir, session_id=self.session_id, write_index=True
+        )
         self.logger.start_session(
             mode=f"{self.config.mode}_interactive",
             provocation_text=self.provocation,
@@ -694,6 +697,20 @@ class InteractiveSession:
         except queue.Empty:
             return None
 
+    def get_all_events(self) -> List[Union[TurnEvent, StateEvent]]:
+        """
+        Drain every pending event from the queue without blocking.
+
+        Returns:
+            Pending events in order (empty if none)
+        """
+        events = []
+        while True:
+            try:
+                events.append(self._event_queue.get_nowait())
+            except queue.Empty:
+                return events
+
     def has_events(self) -> bool:
         """Check if there are pending events in the queue."""
         return not self._event_queue.empty()
@@ -0,0 +1,70 @@
+"""
+JSON serialization helpers for MASE.
+
+Copyright (c) 2025 Mathew Mark Mytka
+SPDX-License-Identifier: LicenseRef-ESL-A
+
+Licensed under the Earthian Stewardship License (ESL-A).
+See LICENSE file for full terms.
+
+Uses orjson when installed (C implementation, native numpy support) and
+falls back to the standard library otherwise. Output is always UTF-8
+bytes so it can be written to binary files or HTTP bodies directly.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+__all__ = [
+    'ORJSON_AVAILABLE',
+    'json_dumps',
+    'json_loads',
+]
+
+
+def _default(obj: Any) -> Any:
+    """Fallback encoder for numpy values under the stdlib encoder."""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(data: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """
+    Serialize data to JSON bytes.
+
+    Args:
+        data: Object to serialize (numpy arrays and scalars are supported)
+        indent: Pretty-print with two-space indentation
+        sort_keys: Emit object keys in sorted order
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(data, option=option)
+
+    return json.dumps(
+        data,
+        indent=2 if indent else None,
+        sort_keys=sort_keys,
+        default=_default
+    ).encode('utf-8')
+
+
+def json_loads(raw: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
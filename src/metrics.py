@@ -16,11 +16,22 @@ Metrics:
 - Entropy Shift (ΔH): Jensen-Shannon divergence for semantic reorganization
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Tuple, Optional, Dict, Any
+from itertools import repeat
+from typing import Callable, List, Tuple, Optional, Dict, Any, Union
 import numpy as np
 from sklearn.cluster import KMeans
 
+# Handle both package and direct execution
+try:
+    from ._session_kernels import embedding_step
+    from .session_logger import decode_embedding
+except ImportError:
+    from _session_kernels import embedding_step
+    from session_logger import decode_embedding
+
 
 # =============================================================================
 # Basic Result Dataclasses
@@ -174,19 +185,49 @@ def entropy_shift(
     Reference:
         Morgoulis (2025), fixed with shared clustering per 2025-12-08
     """
-    n_pre = len(embeddings_pre)
-    n_post = len(embeddings_post)
+    if len(embeddings_pre) < 2 or len(embeddings_post) < 2:
+        return 0.0
+
+    return _split_entropy_shift(
+        np.vstack([embeddings_pre, embeddings_post]),
+        len(embeddings_pre),
+        n_clusters=n_clusters,
+        random_state=random_state
+    )
+
+
+def _split_entropy_shift(
+    all_embeddings: np.ndarray,
+    n_pre: int,
+    n_clusters: int = 8,
+    random_state: int = 42
+) -> float:
+    """
+    entropy_shift(all_embeddings[:n_pre], all_embeddings[n_pre:]).
+
+    Takes the trajectory as one array so callers holding it contiguously
+    (compute_metrics, StreamingMetrics, per-turn windows) cluster the
+    array or view they already have instead of stacking the halves.
+    """
+    n_post = len(all_embeddings) - n_pre
 
     if n_pre < 2 or n_post < 2:
         return 0.0
 
-    n_clusters = min(n_pre + n_post, n_clusters)
+    n_points = n_pre + n_post
+    n_clusters = min(n_points, n_clusters)
     if n_clusters < 2:
         return 0.0
 
-    all_embeddings = np.vstack([embeddings_pre, embeddings_post])
-    kmeans = KMeans(n_clusters=n_clusters, n_init=10, random_state=random_state)
-    labels = kmeans.fit_predict(all_embeddings)
+    if n_clusters == n_points:
+        # Short trajectories (e.g. the 5-turn rolling window): k-means with
+        # one cluster per point converges to one cluster per distinct
+        # embedding, so label each row by its first identical row instead
+        same = (all_embeddings[:, None, :] == all_embeddings[None, :, :]).all(axis=2)
+        labels = same.argmax(axis=1)
+    else:
+        kmeans = KMeans(n_clusters=n_clusters, n_init=10, random_state=random_state)
+        labels = kmeans.fit_predict(all_embeddings)
 
     labels_pre = labels[:n_pre]
     labels_post = labels[n_pre:]
@@ -259,10 +300,8 @@ def compute_metrics(embeddings: np.ndarray, seed: int = 42) -> MetricsResult:
 
     # Entropy shift (first half vs second half)
     mid = n // 2
-    delta_h = entropy_shift(
-        embeddings[:mid],
-        embeddings[mid:],
-        random_state=seed
+    delta_h = _split_entropy_shift(
+        embeddings, mid, random_state=seed
     ) if mid >= 2 else 0.0
 
     return MetricsResult(
@@ -289,9 +328,9 @@ def compute_metrics_from_session(session_data: Dict[str, Any]) -> MetricsResult:
 
     embeddings = []
     for turn in turns:
-        emb = turn.get("embedding")
+        emb = decode_embedding(turn)
         if emb is not None:
-            embeddings.append(np.array(emb))
+            embeddings.append(emb)
 
     if len(embeddings) < 4:
         return MetricsResult(
@@ -309,6 +348,183 @@ def compute_metrics_from_session(session_data: Dict[str, Any]) -> MetricsResult:
     return compute_metrics(embeddings, seed=seed)
 
 
+# =============================================================================
+# Streaming Metrics
+# =============================================================================
+
+class StreamingMetrics:
+    """
+    Incrementally maintained metrics for a growing dialogue trajectory.
+
+    compute_metrics() rediffs the whole trajectory on every call, so a
+    per-turn caller pays O(n·d) each turn. This keeps the per-step local
+    curvatures and cosine velocities as turns arrive (O(d) per update),
+    with a running curvature sum and Welford mean/variance for the
+    velocities, leaving only the scalar DFA fit and the entropy-shift
+    clustering to run over the history. Results match compute_metrics() on
+    the same data to floating-point rounding.
+
+    compute(refresh=False) skips those two as well and reuses the DFA alpha
+    and entropy shift from the last full computation, for callers that can
+    tolerate them lagging a few turns.
+    """
+
+    def __init__(self, seed: int = 42):
+        """
+        Args:
+            seed: Random seed for entropy_shift clustering
+        """
+        self.seed = seed
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear accumulated state."""
+        self._prev: Optional[np.ndarray] = None
+        self._prev_norm = 0.0
+        self._prev_step: Optional[np.ndarray] = None
+        self._velocities: List[float] = []
+        self._curvatures: List[float] = []
+        self._curvature_sum = 0.0
+        self._velocity_mean = 0.0
+        self._velocity_m2 = 0.0
+        self._last_result: Optional[MetricsResult] = None
+        self.n_turns = 0
+
+    @property
+    def last_result(self) -> Optional[MetricsResult]:
+        """Result of the most recent compute() call, or None."""
+        return self._last_result
+
+    @last_result.setter
+    def last_result(self, result: MetricsResult) -> None:
+        # Restoring a cached result lets a later compute(refresh=False)
+        # carry its DFA alpha and entropy shift forward
+        self._last_result = result
+
+    @property
+    def last_norm(self) -> float:
+        """Norm of the most recent embedding (0 before any)."""
+        return self._prev_norm
+
+    @property
+    def last_velocity(self) -> float:
+        """Cosine distance between the two most recent embeddings (0 if fewer)."""
+        return self._velocities[-1] if self._velocities else 0.0
+
+    def update(self, embedding: np.ndarray) -> None:
+        """
+        Add the next embedding in the trajectory.
+
+        Args:
+            embedding: Embedding vector for the new turn
+        """
+        if self._prev is None:
+            norm = np.linalg.norm(embedding)
+        else:
+            has_prev_step = self._prev_step is not None
+            norm, step, velocity, curvature = embedding_step(
+                self._prev,
+                self._prev_norm,
+                self._prev_step if has_prev_step else self._prev,
+                has_prev_step,
+                embedding
+            )
+            self._velocities.append(velocity)
+            if has_prev_step:
+                self._curvatures.append(curvature)
+                self._curvature_sum += float(curvature)
+            self._prev_step = step
+
+            # Welford update of velocity mean and sum of squared deviations,
+            # accumulated in float64 whatever the embedding dtype
+            velocity = float(velocity)
+            delta = velocity - self._velocity_mean
+            self._velocity_mean += delta / len(self._velocities)
+            self._velocity_m2 += delta * (velocity - self._velocity_mean)
+
+        self._prev = embedding
+        self._prev_norm = norm
+        self.n_turns += 1
+
+    def compute(self, embeddings: np.ndarray, refresh: bool = True) -> MetricsResult:
+        """
+        Current metrics for the trajectory seen so far.
+
+        Args:
+            embeddings: All embeddings passed to update(), shape (n, d);
+                used only for the entropy-shift clustering
+            refresh: Recompute DFA alpha and entropy shift. If False and an
+                earlier result exists, reuse its values for those two.
+
+        Returns:
+            MetricsResult identical to compute_metrics(embeddings) when
+            refresh is True
+        """
+        n = self.n_turns
+        n_velocity = len(self._velocities)
+
+        kappa = (
+            float(self._curvature_sum / len(self._curvatures))
+            if n >= 4 and self._curvatures else 0.0
+        )
+
+        if refresh or self._last_result is None:
+            alpha = dfa_alpha(np.array(self._velocities)) if n_velocity >= 8 else 0.5
+
+            mid = n // 2
+            delta_h = _split_entropy_shift(
+                embeddings, mid, random_state=self.seed
+            ) if mid >= 2 else 0.0
+        else:
+            alpha = self._last_result.dfa_alpha
+            delta_h = self._last_result.entropy_shift
+
+        self._last_result = MetricsResult(
+            semantic_curvature=kappa,
+            dfa_alpha=alpha,
+            entropy_shift=delta_h,
+            semantic_velocity_mean=float(self._velocity_mean) if n_velocity > 0 else 0.0,
+            semantic_velocity_std=(
+                float(np.sqrt(max(self._velocity_m2, 0.0) / n_velocity)) if n_velocity > 0 else 0.0
+            ),
+            n_turns=n
+        )
+        return self._last_result
+
+    def compute_window(self, window: np.ndarray) -> MetricsResult:
+        """
+        compute_metrics() over the most recent embeddings.
+
+        The window's velocities and local curvatures are the last ones
+        already computed by update(), so only the DFA fit (windows over
+        eight turns) and the entropy-shift clustering touch the embeddings.
+
+        Args:
+            window: The last w embeddings passed to update(), shape (w, d)
+
+        Returns:
+            MetricsResult identical to compute_metrics(window)
+        """
+        w = len(window)
+        if w > self.n_turns:
+            raise ValueError(f"window of {w} exceeds the {self.n_turns} embeddings seen")
+
+        curvatures = self._curvatures[len(self._curvatures) - (w - 2):] if w >= 4 else []
+        velocity = np.array(self._velocities[len(self._velocities) - (w - 1):] if w >= 2 else [])
+
+        mid = w // 2
+        return MetricsResult(
+            semantic_curvature=float(np.mean(curvatures)) if curvatures else 0.0,
+            dfa_alpha=dfa_alpha(velocity) if len(velocity) >= 8 else 0.5,
+            entropy_shift=_split_entropy_shift(
+                window, mid, random_state=self.seed
+            ) if mid >= 2 else 0.0,
+            semantic_velocity_mean=float(np.mean(velocity)) if len(velocity) > 0 else 0.0,
+            semantic_velocity_std=float(np.std(velocity)) if len(velocity) > 0 else 0.0,
+            n_turns=w
+        )
+
+
 # =============================================================================
 # Enhanced Results with Confidence Intervals
 # =============================================================================
@@ -419,10 +635,239 @@ def _compute_local_curvatures(embeddings: np.ndarray) -> np.ndarray:
     return np.array(local_curvatures)
 
 
+# =============================================================================
+# Bootstrap Helpers
+# =============================================================================
+#
+# Resample indices are drawn up front in the calling process as one
+# (iterations, n) index matrix from a local RandomState(random_state), so
+# results do not depend on n_jobs and the global NumPy RNG is left alone.
+# The draws match the legacy seeded np.random.choice loops exactly. Only the
+# per-resample statistic is evaluated in worker processes.
+
+def _resolve_n_jobs(n_jobs: int) -> int:
+    """Number of worker processes for n_jobs (negative counts back from all CPUs)."""
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return max(1, n_jobs)
+
+
+def _map_chunks(
+    func: Callable[..., list],
+    items: Union[list, np.ndarray],
+    n_jobs: int,
+    *args
+) -> list:
+    """
+    Apply func(chunk, *args) over contiguous chunks of items, in order.
+
+    Args:
+        func: Module-level function returning a list for a chunk of items
+        items: Work items (e.g. rows of a bootstrap index matrix)
+        n_jobs: Worker processes (1 runs inline, -1 uses all CPUs)
+        *args: Extra arguments passed to every call
+
+    Returns:
+        Concatenation of func's results in item order
+    """
+    n_jobs = min(_resolve_n_jobs(n_jobs), len(items))
+    if n_jobs <= 1:
+        return func(items, *args)
+
+    bounds = np.linspace(0, len(items), n_jobs + 1).astype(int)
+    chunks = [items[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:])]
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        parts = executor.map(func, chunks, *(repeat(a) for a in args))
+        return [value for part in parts for value in part]
+
+
+def _path_curvatures(embeddings: np.ndarray, paths: np.ndarray) -> np.ndarray:
+    """
+    Local curvatures along many index paths through the same embeddings.
+
+    Every quantity in the Frenet-Serret formula is a combination of dot
+    products between trajectory points, so one Gram matrix (a single
+    BLAS gemm) serves all paths and the per-step loop becomes vectorized
+    lookups. Identical rows are merged first so repeated points give an
+    exactly zero velocity, as in _compute_local_curvatures().
+
+    Args:
+        embeddings: Array of shape (n, d)
+        paths: Integer array of shape (n_paths, m), m >= 3, of row indices
+
+    Returns:
+        Array of shape (n_paths, m - 2) of local curvatures
+    """
+    unique_rows, inverse = np.unique(embeddings, axis=0, return_inverse=True)
+    points = np.asarray(unique_rows, dtype=np.float64)
+    gram = points @ points.T
+    sq = np.diag(gram)
+
+    ids = inverse.reshape(-1)[paths]
+    i, j, k = ids[:, :-2], ids[:, 1:-1], ids[:, 2:]
+    g_ij, g_ik, g_jk = gram[i, j], gram[i, k], gram[j, k]
+
+    # v = x_j - x_i, a = x_k - 2 x_j + x_i
+    vv = sq[j] - 2 * g_ij + sq[i]
+    av = g_jk - g_ik - 2 * sq[j] + 3 * g_ij - sq[i]
+    aa = sq[k] + 4 * sq[j] + sq[i] - 4 * g_jk + 2 * g_ik - 4 * g_ij
+
+    # A repeated point after a move (j == k) makes a = -v, whose
+    # perpendicular part is exactly zero
+    moving = vv >= 1e-20
+    safe_vv = np.where(moving, vv, 1.0)
+    perp_sq = np.where(j == k, 0.0, np.maximum(aa - av * av / safe_vv, 0.0))
+    return np.where(moving, np.sqrt(perp_sq) / safe_vv, 0.0)
+
+
+def _bootstrap_curvatures(index_sets: np.ndarray, embeddings: np.ndarray) -> List[float]:
+    """Mean local curvature for each resample of embeddings."""
+    if len(index_sets) == 0 or index_sets.shape[1] < 4:
+        return []
+    return _path_curvatures(embeddings, index_sets).mean(axis=1).tolist()
+
+
+def _dfa_with_r2(
+    sig: np.ndarray,
+    min_scale: int,
+    max_scale_fraction: float
+) -> Tuple[float, float, int]:
+    """Internal DFA returning (alpha, r_squared, scales_used)."""
+    x = sig - np.mean(sig)
+    y = np.cumsum(x)
+    N = len(y)
+
+    if N < min_scale * 2:
+        return 0.5, 0.0, 0
+
+    max_scale = max(min(int(N * max_scale_fraction), N // 2), min_scale + 1)
+    scales = np.unique(np.logspace(
+        np.log10(min_scale),
+        np.log10(max_scale),
+        16
+    ).astype(int))
+
+    F = []
+    valid_scales = []
+
+    for s in scales:
+        nseg = N // s
+        if nseg < 2:
+            continue
+
+        segs = y[:nseg * s].reshape(nseg, s)
+        rms = []
+
+        for seg in segs:
+            t_idx = np.arange(s)
+            coeff = np.polyfit(t_idx, seg, 1)
+            trend = np.polyval(coeff, t_idx)
+            detr = seg - trend
+            rms.append(np.sqrt(np.mean(detr**2)))
+
+        F.append(np.mean(rms))
+        valid_scales.append(s)
+
+    if len(F) < 2:
+        return 0.5, 0.0, 0
+
+    log_s = np.log10(np.array(valid_scales))
+    log_F = np.log10(np.array(F))
+
+    # Remove invalid values
+    valid_idx = np.isfinite(log_s) & np.isfinite(log_F)
+    log_s = log_s[valid_idx]
+    log_F = log_F[valid_idx]
+
+    if len(log_s) < 2:
+        return 0.5, 0.0, 0
+
+    alpha, intercept = np.polyfit(log_s, log_F, 1)
+
+    # R-squared
+    predicted = alpha * log_s + intercept
+    ss_res = np.sum((log_F - predicted)**2)
+    ss_tot = np.sum((log_F - np.mean(log_F))**2)
+    r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0.0
+
+    return float(alpha), float(r_squared), len(valid_scales)
+
+
+def _bootstrap_dfa(
+    index_sets: np.ndarray,
+    signal: np.ndarray,
+    min_scale: int,
+    max_scale_fraction: float
+) -> List[float]:
+    """DFA alpha for each resample of signal."""
+    return [
+        _dfa_with_r2(signal[boot_indices], min_scale, max_scale_fraction)[0]
+        for boot_indices in index_sets
+    ]
+
+
+def _compute_js_with_distributions(
+    all_emb: np.ndarray,
+    n_pre: int,
+    n_k: int,
+    random_state: int
+) -> Tuple[float, np.ndarray, np.ndarray]:
+    """Compute JS divergence and return distributions."""
+    n_k = min(len(all_emb), n_k)
+    if n_k < 2:
+        return 0.0, np.array([]), np.array([])
+
+    kmeans = KMeans(n_clusters=n_k, n_init=10, random_state=random_state)
+    labels = kmeans.fit_predict(all_emb)
+
+    labels_pre = labels[:n_pre]
+    labels_post = labels[n_pre:]
+
+    def _dist(lab, n_k):
+        counts = np.zeros(n_k)
+        for l in lab:
+            counts[l] += 1
+        return counts / counts.sum()
+
+    p = _dist(labels_pre, n_k)
+    q = _dist(labels_post, n_k)
+
+    # JS divergence
+    m = 0.5 * (p + q)
+    p_safe = np.clip(p, 1e-12, 1)
+    q_safe = np.clip(q, 1e-12, 1)
+    m_safe = np.clip(m, 1e-12, 1)
+
+    kl_pm = np.sum(p_safe * np.log2(p_safe / m_safe))
+    kl_qm = np.sum(q_safe * np.log2(q_safe / m_safe))
+    js = 0.5 * kl_pm + 0.5 * kl_qm
+
+    return float(js), p, q
+
+
+def _bootstrap_js(
+    index_pairs: List[Tuple[np.ndarray, np.ndarray]],
+    embeddings_pre: np.ndarray,
+    embeddings_post: np.ndarray,
+    n_clusters: int,
+    random_state: int
+) -> List[float]:
+    """JS divergence for each (pre, post) resample."""
+    values = []
+    for boot_pre_idx, boot_post_idx in index_pairs:
+        boot_all = np.vstack([embeddings_pre[boot_pre_idx], embeddings_post[boot_post_idx]])
+        boot_js, _, _ = _compute_js_with_distributions(
+            boot_all, len(embeddings_pre), n_clusters, random_state
+        )
+        values.append(boot_js)
+    return values
+
+
 def semantic_curvature_with_ci(
     embeddings: np.ndarray,
     bootstrap_iterations: int = 500,
-    random_state: int = 42
+    random_state: int = 42,
+    n_jobs: int = 1
 ) -> CurvatureResultWithCI:
     """
     Calculate Semantic Curvature (Δκ) with bootstrap confidence interval.
@@ -431,11 +876,13 @@ def semantic_curvature_with_ci(
         embeddings: Array of shape (n_turns, embedding_dim)
         bootstrap_iterations: Number of bootstrap samples
         random_state: Random seed for reproducibility
+        n_jobs: Worker processes for the bootstrap (-1 = all CPUs).
+            Results are identical for any value.
 
     Returns:
         CurvatureResultWithCI with CI and p-value
     """
-    np.random.seed(random_state)
+    rng = np.random.RandomState(random_state)
     n = len(embeddings)
 
     if n < 4:
@@ -465,13 +912,8 @@ def semantic_curvature_with_ci(
     curvature_std = float(np.std(local_curvatures))
 
     # Bootstrap confidence interval
-    bootstrap_curvatures = []
-    for _ in range(bootstrap_iterations):
-        boot_indices = np.sort(np.random.choice(n, size=n, replace=True))
-        boot_embeddings = embeddings[boot_indices]
-        boot_local = _compute_local_curvatures(boot_embeddings)
-        if len(boot_local) > 0:
-            bootstrap_curvatures.append(np.mean(boot_local))
+    index_sets = np.sort(rng.randint(0, n, size=(bootstrap_iterations, n)), axis=1)
+    bootstrap_curvatures = _map_chunks(_bootstrap_curvatures, index_sets, n_jobs, embeddings)
 
     if len(bootstrap_curvatures) > 0:
         ci_lower = float(np.percentile(bootstrap_curvatures, 2.5))
@@ -480,17 +922,10 @@ def semantic_curvature_with_ci(
         ci_lower, ci_upper = curvature, curvature
 
     # Statistical significance: compare to shuffled trajectory (null hypothesis)
-    null_curvatures = []
-    for _ in range(200):
-        null_embeddings = np.random.permutation(embeddings)
-        null_local = _compute_local_curvatures(null_embeddings)
-        if len(null_local) > 0:
-            null_curvatures.append(np.mean(null_local))
-
-    if len(null_curvatures) > 0:
-        p_value = float(np.mean(np.array(null_curvatures) >= curvature))
-    else:
-        p_value = 1.0
+    # (permuting indices draws the same orders as permuting the rows)
+    null_orders = np.array([rng.permutation(n) for _ in range(200)])
+    null_curvatures = _path_curvatures(embeddings, null_orders).mean(axis=1)
+    p_value = float(np.mean(null_curvatures >= curvature))
 
     return CurvatureResultWithCI(
         curvature=curvature,
@@ -507,7 +942,8 @@ def dfa_alpha_with_ci(
     min_scale: int = 4,
     max_scale_fraction: float = 0.25,
     bootstrap_iterations: int = 300,
-    random_state: int = 42
+    random_state: int = 42,
+    n_jobs: int = 1
 ) -> DFAResultWithCI:
     """
     Calculate DFA alpha with bootstrap confidence interval and fit quality.
@@ -518,75 +954,15 @@ def dfa_alpha_with_ci(
         max_scale_fraction: Maximum window as fraction of length
         bootstrap_iterations: Number of bootstrap samples
         random_state: Random seed
+        n_jobs: Worker processes for the bootstrap (-1 = all CPUs)
 
     Returns:
         DFAResultWithCI with CI and r_squared
     """
-    np.random.seed(random_state)
-
-    def _dfa_with_r2(sig: np.ndarray) -> Tuple[float, float, int]:
-        """Internal DFA returning (alpha, r_squared, scales_used)."""
-        x = sig - np.mean(sig)
-        y = np.cumsum(x)
-        N = len(y)
-
-        if N < min_scale * 2:
-            return 0.5, 0.0, 0
-
-        max_scale = max(min(int(N * max_scale_fraction), N // 2), min_scale + 1)
-        scales = np.unique(np.logspace(
-            np.log10(min_scale),
-            np.log10(max_scale),
-            16
-        ).astype(int))
-
-        F = []
-        valid_scales = []
-
-        for s in scales:
-            nseg = N // s
-            if nseg < 2:
-                continue
-
-            segs = y[:nseg * s].reshape(nseg, s)
-            rms = []
-
-            for seg in segs:
-                t_idx = np.arange(s)
-                coeff = np.polyfit(t_idx, seg, 1)
-                trend = np.polyval(coeff, t_idx)
-                detr = seg - trend
-                rms.append(np.sqrt(np.mean(detr**2)))
-
-            F.append(np.mean(rms))
-            valid_scales.append(s)
-
-        if len(F) < 2:
-            return 0.5, 0.0, 0
-
-        log_s = np.log10(np.array(valid_scales))
-        log_F = np.log10(np.array(F))
-
-        # Remove invalid values
-        valid_idx = np.isfinite(log_s) & np.isfinite(log_F)
-        log_s = log_s[valid_idx]
-        log_F = log_F[valid_idx]
-
-        if len(log_s) < 2:
-            return 0.5, 0.0, 0
-
-        alpha, intercept = np.polyfit(log_s, log_F, 1)
-
-        # R-squared
-        predicted = alpha * log_s + intercept
-        ss_res = np.sum((log_F - predicted)**2)
-        ss_tot = np.sum((log_F - np.mean(log_F))**2)
-        r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0.0
-
-        return float(alpha), float(r_squared), len(valid_scales)
+    rng = np.random.RandomState(random_state)
 
     # Primary computation
-    alpha, r_squared, scales_used = _dfa_with_r2(signal)
+    alpha, r_squared, scales_used = _dfa_with_r2(signal, min_scale, max_scale_fraction)
 
     if len(signal) < 8:
         return DFAResultWithCI(
@@ -598,12 +974,10 @@ def dfa_alpha_with_ci(
         )
 
     # Bootstrap CI
-    bootstrap_alphas = []
-    for _ in range(bootstrap_iterations):
-        boot_indices = np.random.choice(len(signal), size=len(signal), replace=True)
-        boot_signal = signal[boot_indices]
-        boot_alpha, _, _ = _dfa_with_r2(boot_signal)
-        bootstrap_alphas.append(boot_alpha)
+    index_sets = rng.randint(0, len(signal), size=(bootstrap_iterations, len(signal)))
+    bootstrap_alphas = _map_chunks(
+        _bootstrap_dfa, index_sets, n_jobs, signal, min_scale, max_scale_fraction
+    )
 
     if len(bootstrap_alphas) > 0:
         ci_lower = float(np.percentile(bootstrap_alphas, 2.5))
@@ -625,7 +999,8 @@ def entropy_shift_with_ci(
     embeddings_post: np.ndarray,
     n_clusters: int = 8,
     bootstrap_iterations: int = 200,
-    random_state: int = 42
+    random_state: int = 42,
+    n_jobs: int = 1
 ) -> EntropyResultWithCI:
     """
     Calculate Entropy Shift (ΔH) with bootstrap CI and transition summary.
@@ -636,11 +1011,12 @@ def entropy_shift_with_ci(
         n_clusters: Number of clusters
         bootstrap_iterations: Number of bootstrap samples
         random_state: Random seed
+        n_jobs: Worker processes for the bootstrap (-1 = all CPUs)
 
     Returns:
         EntropyResultWithCI with CI and distributions
     """
-    np.random.seed(random_state)
+    rng = np.random.RandomState(random_state)
 
     n_pre = len(embeddings_pre)
     n_post = len(embeddings_post)
@@ -654,57 +1030,23 @@ def entropy_shift_with_ci(
             transition_summary="Insufficient data"
         )
 
-    def _compute_js_with_distributions(
-        all_emb: np.ndarray,
-        n_pre: int,
-        n_k: int
-    ) -> Tuple[float, np.ndarray, np.ndarray]:
-        """Compute JS divergence and return distributions."""
-        n_k = min(len(all_emb), n_k)
-        if n_k < 2:
-            return 0.0, np.array([]), np.array([])
-
-        kmeans = KMeans(n_clusters=n_k, n_init=10, random_state=random_state)
-        labels = kmeans.fit_predict(all_emb)
-
-        labels_pre = labels[:n_pre]
-        labels_post = labels[n_pre:]
-
-        def _dist(lab, n_k):
-            counts = np.zeros(n_k)
-            for l in lab:
-                counts[l] += 1
-            return counts / counts.sum()
-
-        p = _dist(labels_pre, n_k)
-        q = _dist(labels_post, n_k)
-
-        # JS divergence
-        m = 0.5 * (p + q)
-        p_safe = np.clip(p, 1e-12, 1)
-        q_safe = np.clip(q, 1e-12, 1)
-        m_safe = np.clip(m, 1e-12, 1)
-
-        kl_pm = np.sum(p_safe * np.log2(p_safe / m_safe))
-        kl_qm = np.sum(q_safe * np.log2(q_safe / m_safe))
-        js = 0.5 * kl_pm + 0.5 * kl_qm
-
-        return float(js), p, q
-
     # Primary computation
     all_embeddings = np.vstack([embeddings_pre, embeddings_post])
     js, pre_dist, post_dist = _compute_js_with_distributions(
-        all_embeddings, n_pre, n_clusters
+        all_embeddings, n_pre, n_clusters, random_state
     )
 
     # Bootstrap CI
-    bootstrap_js = []
-    for _ in range(bootstrap_iterations):
-        boot_pre_idx = np.random.choice(n_pre, n_pre, replace=True)
-        boot_post_idx = np.random.choice(n_post, n_post, replace=True)
-        boot_all = np.vstack([embeddings_pre[boot_pre_idx], embeddings_post[boot_post_idx]])
-        boot_js, _, _ = _compute_js_with_distributions(boot_all, n_pre, n_clusters)
-        bootstrap_js.append(boot_js)
+    # Pre and post draws alternate, so fill the two index matrices row by row
+    boot_pre_idx = np.empty((bootstrap_iterations, n_pre), dtype=np.int64)
+    boot_post_idx = np.empty((bootstrap_iterations, n_post), dtype=np.int64)
+    for b in range(bootstrap_iterations):
+        boot_pre_idx[b] = rng.randint(0, n_pre, size=n_pre)
+        boot_post_idx[b] = rng.randint(0, n_post, size=n_post)
+    bootstrap_js = _map_chunks(
+        _bootstrap_js, list(zip(boot_pre_idx, boot_post_idx)), n_jobs,
+        embeddings_pre, embeddings_post, n_clusters, random_state
+    )
 
     if len(bootstrap_js) > 0:
         ci_lower = float(np.percentile(bootstrap_js, 2.5))
@@ -745,7 +1087,8 @@ def entropy_shift_with_ci(
 def compute_metrics_with_ci(
     embeddings: np.ndarray,
     bootstrap_iterations: int = 300,
-    random_state: int = 42
+    random_state: int = 42,
+    n_jobs: int = 1
 ) -> MetricsResultWithCI:
     """
     Compute all dialogue metrics with confidence intervals.
@@ -757,6 +1100,8 @@ def compute_metrics_with_ci(
         embeddings: Array of shape (n_turns, embedding_dim)
         bootstrap_iterations: Number of bootstrap samples
         random_state: Random seed
+        n_jobs: Worker processes for each bootstrap (-1 = all CPUs).
+            Results are identical for any value.
 
     Returns:
         MetricsResultWithCI with all metrics, CIs, and significance
@@ -777,7 +1122,8 @@ def compute_metrics_with_ci(
     curv_result = semantic_curvature_with_ci(
         embeddings,
         bootstrap_iterations=bootstrap_iterations,
-        random_state=random_state
+        random_state=random_state,
+        n_jobs=n_jobs
     )
 
     # Semantic velocity for DFA
@@ -787,7 +1133,8 @@ def compute_metrics_with_ci(
     dfa_result = dfa_alpha_with_ci(
         velocity,
         bootstrap_iterations=bootstrap_iterations,
-        random_state=random_state
+        random_state=random_state,
+        n_jobs=n_jobs
     ) if len(velocity) >= 8 else DFAResultWithCI(
         alpha=0.5,
         r_squared=0.0,
@@ -802,7 +1149,8 @@ def compute_metrics_with_ci(
         embeddings[:mid],
         embeddings[mid:],
         bootstrap_iterations=bootstrap_iterations,
-        random_state=random_state
+        random_state=random_state,
+        n_jobs=n_jobs
     ) if mid >= 2 else EntropyResultWithCI(
         js_divergence=0.0,
         confidence_interval=(0.0, 0.0),
@@ -12,7 +12,6 @@ selection logic for experimental reproducibility.
 """
 
 import re
-import json
 import random
 import time
 from pathlib import Path
@@ -53,8 +52,8 @@ from .agents import (
     Agent, EnsembleConfig, load_ensemble, load_personas,
     Persona, compose_system_prompt
 )
-from .embedding_service import EmbeddingService
-from .session_logger import SessionLogger, TurnRecord
+from .embedding_service import EmbeddingService, get_embedding_service
+from .session_logger import SessionLogger, TurnRecord, load_checkpoint
 
 
 @dataclass
@@ -281,7 +280,8 @@ class DialogueOrchestrator:
 
         # Initialize components
         if compute_embeddings and self.embedding_service is None:
-            self.embedding_service = EmbeddingService()
+            # Shared with analyze_session so the model is loaded once
+            self.embedding_service = get_embedding_service()
 
         turn_selector = TurnSelector(self.agents, seed)
         logger = SessionLogger(output_dir)
@@ -495,8 +495,7 @@ class DialogueOrchestrator:
     def _load_checkpoint(self, path: Path) -> Optional[Dict]:
         """Load dialogue state from checkpoint file."""
         try:
-            with open(path) as f:
-                data = json.load(f)
+            data = load_checkpoint(path)
 
             history = [
                 (t["agent_id"], t["agent_name"], t["content"])
@@ -15,6 +15,12 @@ from pathlib import Path
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass
 
+# Handle both package and direct execution
+try:
+    from .session_logger import CHECKPOINT_LOG_SUFFIX, CHECKPOINT_SUFFIX, load_checkpoint
+except ImportError:
+    from session_logger import CHECKPOINT_LOG_SUFFIX, CHECKPOINT_SUFFIX, load_checkpoint
+
 
 @dataclass
 class CheckpointInfo:
@@ -40,7 +46,7 @@ def find_checkpoints(runs_dir: Path) -> List[CheckpointInfo]:
     """
     checkpoints = []
 
-    for checkpoint_path in runs_dir.rglob("*_checkpoint.json"):
+    for checkpoint_path in _checkpoint_files(runs_dir, recursive=True):
         try:
             info = analyze_checkpoint(checkpoint_path)
             if info:
@@ -58,19 +64,20 @@ def analyze_checkpoint(path: Path) -> Optional[CheckpointInfo]:
     Analyze a checkpoint file to determine its state.
 
     Args:
-        path: Path to checkpoint JSON file
+        path: Path to checkpoint JSON file or NDJSON checkpoint log
 
     Returns:
         CheckpointInfo or None if invalid
     """
     try:
-        with open(path) as f:
-            data = json.load(f)
+        data = load_checkpoint(path)
 
         completed_turns = len(data.get("turns", []))
 
         # Check for corresponding completed session
-        session_path = path.parent / path.name.replace("_checkpoint", "")
+        session_path = path.parent / (
+            path.name.replace(CHECKPOINT_LOG_SUFFIX, ".json").replace(CHECKPOINT_SUFFIX, ".json")
+        )
         is_complete = session_path.exists()
 
         return CheckpointInfo(
@@ -150,7 +157,7 @@ def _find_latest_checkpoint(condition_dir: Path) -> Optional[Path]:
     if not condition_dir.exists():
         return None
 
-    checkpoints = list(condition_dir.glob("session_*_checkpoint.json"))
+    checkpoints = _checkpoint_files(condition_dir)
     if not checkpoints:
         return None
 
@@ -158,6 +165,19 @@ def _find_latest_checkpoint(condition_dir: Path) -> Optional[Path]:
     return max(checkpoints, key=lambda p: p.stat().st_mtime)
 
 
+def _checkpoint_files(directory: Path, recursive: bool = False) -> List[Path]:
+    """Consolidated checkpoints and checkpoint logs (sessions still running or interrupted)."""
+    if recursive:
+        glob, prefix = directory.rglob, "*"
+    else:
+        glob, prefix = directory.glob, "session_*"
+    return [
+        path
+        for suffix in (CHECKPOINT_SUFFIX, CHECKPOINT_LOG_SUFFIX)
+        for path in glob(prefix + suffix)
+    ]
+
+
 def print_status(runs_dir: Path):
     """Print status of all experiments in runs directory."""
     print("\n" + "=" * 60)
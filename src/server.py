@@ -9,16 +9,36 @@ See LICENSE file for full terms.
 
 Provides REST API and Server-Sent Events for real-time
 dialogue streaming with human participation.
+
+For many concurrent SSE viewers, serve with a single gevent worker:
+
+    gunicorn -k gevent -w 1 --worker-connections 1000 --chdir src server:app
+
+The worker monkey-patches threading and queue, so session threads and
+InteractiveSession.get_next_event() become cooperative with no code
+changes. Sessions are held in process memory, hence one worker.
 """
 
-import json
+import os
+import tempfile
+import threading
+import time
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import asdict
+from functools import wraps
 
-from flask import Flask, request, jsonify, Response, send_from_directory
+from flask import Flask, request, jsonify, Response, abort, send_file
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # Handle both package and direct execution
 try:
     from .ollama_client import OllamaClient
@@ -35,6 +55,11 @@ try:
         create_interactive_session
     )
     from .session_analysis import analyze_session
+    from .jsonio import ORJSON_AVAILABLE, json_dumps, json_loads
+    from .session_logger import (
+        CHECKPOINT_LOG_SUFFIX, PROVOCATION_PREVIEW_CHARS,
+        append_session_index, load_checkpoint, load_session_index, write_session_index
+    )
 except ImportError:
     from ollama_client import OllamaClient
     from agents import (
@@ -50,9 +75,44 @@ except ImportError:
         create_interactive_session
     )
     from session_analysis import analyze_session
+    from jsonio import ORJSON_AVAILABLE, json_dumps, json_loads
+    from session_logger import (
+        CHECKPOINT_LOG_SUFFIX, PROVOCATION_PREVIEW_CHARS,
+        append_session_index, load_checkpoint, load_session_index, write_session_index
+    )
+
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by the shared jsonio helpers.
+
+    Routes jsonify() and request.get_json() through orjson when it is
+    installed. Without orjson, or when the caller passes encoder options
+    (e.g. the indent Flask adds for debug pretty-printing), it defers to
+    Flask's default provider.
+    """
+
+    @staticmethod
+    def default(o):
+        # numpy arrays and scalars, which orjson serializes natively
+        if hasattr(o, 'tolist'):
+            return o.tolist()
+        return DefaultJSONProvider.default(o)
+
+    def dumps(self, obj, **kwargs) -> str:
+        if not ORJSON_AVAILABLE or kwargs:
+            return super().dumps(obj, **kwargs)
+        return json_dumps(obj, sort_keys=self.sort_keys).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if not ORJSON_AVAILABLE or kwargs:
+            return super().loads(s, **kwargs)
+        return json_loads(s)
+
 
 # Flask app
 app = Flask(__name__, static_folder='../web', static_url_path='')
+app.json = FastJSONProvider(app)
 CORS(app)
 
 # Active sessions store
@@ -65,10 +125,41 @@ TEMPLATES_DIR = PROJECT_ROOT / "agents" / "templates"
 CONFIG_DIR = PROJECT_ROOT / "experiments" / "config"
 SESSIONS_DIR = PROJECT_ROOT / "sessions"
 
+# Fixed parts of session file names: session_<id>_checkpoint.json etc.
+# Running (or interrupted) sessions have a _checkpoint.ndjson log instead.
+_SESSION_PREFIX = 'session_'
+_CHECKPOINT_SUFFIX = '_checkpoint.json'
+_CHECKPOINT_LOG_SUFFIX = CHECKPOINT_LOG_SUFFIX
+_ANALYSIS_SUFFIX = '_analysis.json'
+_DIALOGUE_SUFFIX = '_dialogue.json'
+
+# Checkpoint list metadata, keyed by path -> (st_mtime_ns, st_size, metadata)
+_session_meta_cache: Dict[str, Tuple[int, int, dict]] = {}
+
 # Persona and template loaders (cached)
 _persona_loader: Optional[PersonaLoader] = None
 _template_loader: Optional[TemplateLoader] = None
 
+# Per-persona display lookups, built from the loader on first use
+_persona_colors: Optional[Dict[str, str]] = None
+_persona_descriptions: Optional[Dict[str, str]] = None
+
+# index.html as (st_mtime_ns, etag, body), re-read when the file changes
+_index_html: Optional[Tuple[int, str, bytes]] = None
+
+# History display names, keyed by (agent_id, agent_name)
+_display_names: Dict[Tuple[str, Optional[str]], str] = {}
+
+# /api/agents payload, keyed by the newest persona/template mtime
+_agents_cache: Optional[Tuple[int, List[dict]]] = None
+
+# Ollama availability, refreshed at most once per TTL. The lock also
+# collapses concurrent refreshes into a single round-trip to the daemon.
+OLLAMA_STATUS_TTL = 2.0
+_ollama_status: dict = {"running": False, "running_at": float('-inf'),
+                        "models": [], "models_at": float('-inf')}
+_ollama_status_lock = threading.Lock()
+
 
 def get_persona_loader() -> PersonaLoader:
     """Get cached persona loader."""
@@ -88,31 +179,141 @@ def get_template_loader() -> TemplateLoader:
     return _template_loader
 
 
+def persona_files_mtime() -> int:
+    """Newest st_mtime_ns across the persona and template directories.
+
+    Directory mtimes are included so added or removed YAML files count as
+    a change, not just edits to existing ones.
+    """
+    newest = 0
+    for directory in (AGENTS_DIR, TEMPLATES_DIR):
+        try:
+            newest = max(newest, os.stat(directory).st_mtime_ns)
+            with os.scandir(directory) as it:
+                for entry in it:
+                    newest = max(newest, entry.stat().st_mtime_ns)
+        except FileNotFoundError:
+            continue
+    return newest
+
+
+def reset_persona_caches() -> None:
+    """Drop the cached loaders and lookups so the next access reloads YAML."""
+    global _persona_loader, _template_loader, _persona_colors, _persona_descriptions
+    _persona_loader = None
+    _template_loader = None
+    _persona_colors = None
+    _persona_descriptions = None
+
+
+def _build_persona_lookups() -> None:
+    """Build the color and description tables from the persona loader.
+
+    Both are defaultdicts so per-event lookups are a single subscript, with
+    unknown agent IDs falling through to the neutral default.
+    """
+    global _persona_colors, _persona_descriptions
+    personas = get_persona_loader().load_all()
+
+    colors = defaultdict(lambda: "#888888")
+    # Fallback for human and researcher
+    colors["human"] = "#B49070"
+    colors["researcher"] = "#A0A0B4"
+    colors.update((pid, p.color) for pid, p in personas.items())
+
+    descriptions = defaultdict(str)
+    descriptions["human"] = "Human participant"
+    descriptions["researcher"] = "Researcher interjection"
+    descriptions.update((pid, p.description) for pid, p in personas.items())
+
+    _persona_colors = colors
+    _persona_descriptions = descriptions
+
+
 def get_persona_color(persona_id: str) -> str:
     """Get color for a persona from YAML definition."""
-    loader = get_persona_loader()
-    persona = loader.get(persona_id)
-    if persona:
-        return persona.color
-    # Fallback for human and researcher
-    if persona_id == "human":
-        return "#B49070"
-    if persona_id == "researcher":
-        return "#A0A0B4"
-    return "#888888"
+    if _persona_colors is None:
+        _build_persona_lookups()
+    return _persona_colors[persona_id]
 
 
 def get_persona_description(persona_id: str) -> str:
     """Get description for a persona from YAML definition."""
-    loader = get_persona_loader()
-    persona = loader.get(persona_id)
-    if persona:
-        return persona.description
-    if persona_id == "human":
-        return "Human participant"
-    if persona_id == "researcher":
-        return "Researcher interjection"
-    return ""
+    if _persona_descriptions is None:
+        _build_persona_lookups()
+    return _persona_descriptions[persona_id]
+
+
+def require_session(view):
+    """Resolve the <session_id> route argument to its active session.
+
+    The wrapped view receives the session as a ``session`` keyword
+    argument; unknown IDs get a 404 before the view runs.
+    """
+    @wraps(view)
+    def wrapper(session_id: str, **kwargs):
+        session = sessions.get(session_id)
+        if session is None:
+            return jsonify({"error": "Session not found"}), 404
+        return view(session_id, session=session, **kwargs)
+    return wrapper
+
+
+def get_display_name(agent_id: str, agent_name: Optional[str]) -> str:
+    """Short display name for a history entry (e.g. "luma-v2" -> "Luma").
+
+    The set of agents is small and fixed per session, so names are
+    normalized once and memoized.
+    """
+    key = (agent_id, agent_name)
+    name = _display_names.get(key)
+    if name is None:
+        name = "You" if agent_id == "human" else (
+            agent_name.split('-')[0].capitalize() if agent_name else agent_id
+        )
+        _display_names[key] = name
+    return name
+
+
+def session_file(session_id: str, suffix: str) -> str:
+    """Path of a session artifact, e.g. session_file(sid, _CHECKPOINT_SUFFIX).
+
+    Returns a plain string; request handlers only stat, open and send these
+    paths, so there is no need to build pathlib objects per request.
+    """
+    return os.path.join(SESSIONS_DIR, _SESSION_PREFIX + session_id + suffix)
+
+
+def find_checkpoint(session_id: str) -> Optional[str]:
+    """Consolidated checkpoint of a session, else its checkpoint log, else None."""
+    for suffix in (_CHECKPOINT_SUFFIX, _CHECKPOINT_LOG_SUFFIX):
+        path = session_file(session_id, suffix)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def write_json_atomic(path: str, data, indent: bool = False) -> None:
+    """Write JSON to a temp file, fsync, then rename over the target.
+
+    Readers never observe a partially written file, so a crash mid-write
+    cannot leave a corrupt analysis behind.
+    """
+    # Unique temp file per writer, so concurrent writers of the same path
+    # never share (and truncate) one temp file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(json_dumps(data, indent=indent))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
 
 
 # ============================================================================
@@ -121,25 +322,62 @@ def get_persona_description(persona_id: str) -> str:
 
 @app.route('/')
 def index():
-    """Serve the main HTML page."""
-    return send_from_directory(app.static_folder, 'index.html')
+    """Serve the main HTML page from memory, re-reading it only on change."""
+    global _index_html
+    path = os.path.join(app.static_folder, 'index.html')
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        abort(404)
+
+    if _index_html is None or _index_html[0] != mtime:
+        with open(path, 'rb') as f:
+            body = f.read()
+        _index_html = (mtime, f'{mtime}-{len(body)}', body)
+
+    response = Response(_index_html[2], mimetype='text/html')
+    response.set_etag(_index_html[1])
+    return response.make_conditional(request)
 
 
 # ============================================================================
 # API: System status
 # ============================================================================
 
+def get_ollama_status(include_models: bool = True) -> Tuple[bool, List[str]]:
+    """Get Ollama availability and models, cached for OLLAMA_STATUS_TTL.
+
+    Args:
+        include_models: Also refresh the model list (skip when only the
+            running flag is needed)
+
+    Returns:
+        Tuple of (running, available model names)
+    """
+    now = time.monotonic()
+    with _ollama_status_lock:
+        status = _ollama_status
+        if now - status["running_at"] >= OLLAMA_STATUS_TTL:
+            status["running"] = OllamaClient.is_running()
+            status["running_at"] = now
+
+        if include_models and now - status["models_at"] >= OLLAMA_STATUS_TTL:
+            models = []
+            if status["running"]:
+                try:
+                    models = OllamaClient.get_available_models()
+                except Exception:
+                    pass
+            status["models"] = models
+            status["models_at"] = now
+
+        return status["running"], list(status["models"])
+
+
 @app.route('/api/status')
 def get_status():
     """Get system status including Ollama availability."""
-    ollama_running = OllamaClient.is_running()
-    models = []
-
-    if ollama_running:
-        try:
-            models = OllamaClient.get_available_models()
-        except Exception:
-            pass
+    ollama_running, models = get_ollama_status()
 
     return jsonify({
         "ollama_running": ollama_running,
@@ -253,8 +491,18 @@ def get_agents():
     """Get list of all agents with metadata.
 
     This endpoint is maintained for backward compatibility.
-    Internally uses the persona system.
+    Internally uses the persona system. The payload is rebuilt only when
+    a persona or template file changes.
     """
+    global _agents_cache
+    mtime = persona_files_mtime()
+    if _agents_cache is not None and _agents_cache[0] == mtime:
+        return jsonify({"agents": _agents_cache[1]})
+
+    # Files changed since the last build: reload from YAML
+    if _agents_cache is not None:
+        reset_persona_caches()
+
     agents = []
 
     # Load personas
@@ -283,6 +531,7 @@ def get_agents():
         "is_human": True
     })
 
+    _agents_cache = (mtime, agents)
     return jsonify({"agents": agents})
 
 
@@ -318,7 +567,8 @@ def start_session():
             return jsonify({"error": "Maximum 7 personas allowed"}), 400
 
     # Check Ollama
-    if not OllamaClient.is_running():
+    running, _ = get_ollama_status(include_models=False)
+    if not running:
         return jsonify({"error": "Ollama is not running"}), 503
 
     # Load config
@@ -357,20 +607,15 @@ def start_session():
 
 
 @app.route('/api/session/<session_id>/state')
-def get_session_state(session_id: str):
+@require_session
+def get_session_state(session_id: str, session: InteractiveSession):
     """Get current state of a session."""
-    if session_id not in sessions:
-        return jsonify({"error": "Session not found"}), 404
-
-    session = sessions[session_id]
     state = session.get_state()
 
     # Add history
     history = []
     for agent_id, agent_name, content in session.dialogue_history:
-        name = "You" if agent_id == "human" else (
-            agent_name.split('-')[0].capitalize() if agent_name else agent_id
-        )
+        name = get_display_name(agent_id, agent_name)
         history.append({
             "agent_id": agent_id,
             "name": name,
@@ -385,7 +630,8 @@ def get_session_state(session_id: str):
 
 
 @app.route('/api/session/<session_id>/stream')
-def stream_session(session_id: str):
+@require_session
+def stream_session(session_id: str, session: InteractiveSession):
     """SSE endpoint for streaming dialogue turns.
 
     Queue-based architecture:
@@ -393,11 +639,6 @@ def stream_session(session_id: str):
     - This endpoint reads from queue and sends SSE events
     - Reconnection-safe: queue persists across SSE connections
     """
-    if session_id not in sessions:
-        return jsonify({"error": "Session not found"}), 404
-
-    session = sessions[session_id]
-
     # Start the session if not already started (idempotent)
     session.start()
 
@@ -407,11 +648,9 @@ def stream_session(session_id: str):
             while True:
                 # Check if session is complete
                 if session.state == SessionState.COMPLETE:
-                    # Drain any remaining events
-                    while session.has_events():
-                        event = session.get_next_event(timeout=0.1)
-                        if event:
-                            yield format_sse_event(event)
+                    # Drain any remaining events without waiting on an empty queue
+                    for event in session.get_all_events():
+                        yield format_sse_event(event)
                     break
 
                 # Get next event with timeout (allows periodic checking)
@@ -419,7 +658,7 @@ def stream_session(session_id: str):
 
                 if event is None:
                     # Timeout - send keepalive comment
-                    yield ": keepalive\n\n"
+                    yield _SSE_KEEPALIVE
                     continue
 
                 yield format_sse_event(event)
@@ -433,7 +672,7 @@ def stream_session(session_id: str):
             pass
         except Exception as e:
             error_data = {"type": "error", "message": str(e)}
-            yield f"event: error\ndata: {json.dumps(error_data)}\n\n"
+            yield _SSE_ERROR_PREFIX + json_dumps(error_data) + _SSE_TERM
 
     return Response(
         generate(),
@@ -446,8 +685,21 @@ def stream_session(session_id: str):
     )
 
 
-def format_sse_event(event) -> str:
-    """Format a TurnEvent, StateEvent, or MetricsEvent as SSE data."""
+# SSE framing, encoded once at import
+_SSE_TURN_PREFIX = b"event: turn\ndata: "
+_SSE_STATE_PREFIX = b"event: state\ndata: "
+_SSE_METRICS_PREFIX = b"event: metrics\ndata: "
+_SSE_ERROR_PREFIX = b"event: error\ndata: "
+_SSE_KEEPALIVE = b": keepalive\n\n"
+_SSE_TERM = b"\n\n"
+
+
+def format_sse_event(event) -> bytes:
+    """Format a TurnEvent, StateEvent, or MetricsEvent as SSE data.
+
+    Returns the encoded frame so the JSON bytes go to the wire without a
+    str round-trip.
+    """
     if isinstance(event, TurnEvent):
         data = {
             "type": "turn",
@@ -460,7 +712,7 @@ def format_sse_event(event) -> str:
             "is_human": event.is_human,
             "color": get_persona_color(event.agent_id)
         }
-        return f"event: turn\ndata: {json.dumps(data)}\n\n"
+        return _SSE_TURN_PREFIX + json_dumps(data) + _SSE_TERM
 
     elif isinstance(event, StateEvent):
         data = {
@@ -469,7 +721,7 @@ def format_sse_event(event) -> str:
             "next_speaker": event.next_speaker,
             "message": event.message
         }
-        return f"event: state\ndata: {json.dumps(data)}\n\n"
+        return _SSE_STATE_PREFIX + json_dumps(data) + _SSE_TERM
 
     elif isinstance(event, MetricsEvent):
         data = {
@@ -485,49 +737,39 @@ def format_sse_event(event) -> str:
             "voice_distinctiveness": event.voice_distinctiveness,
             "velocity_magnitude": event.velocity_magnitude
         }
-        return f"event: metrics\ndata: {json.dumps(data)}\n\n"
+        return _SSE_METRICS_PREFIX + json_dumps(data) + _SSE_TERM
 
-    return ""
+    return b""
 
 
 @app.route('/api/session/<session_id>/pause', methods=['POST'])
-def pause_session(session_id: str):
+@require_session
+def pause_session(session_id: str, session: InteractiveSession):
     """Pause an active session."""
-    if session_id not in sessions:
-        return jsonify({"error": "Session not found"}), 404
-
-    session = sessions[session_id]
     session.pause()
 
     return jsonify({"status": "paused"})
 
 
 @app.route('/api/session/<session_id>/resume', methods=['POST'])
-def resume_session(session_id: str):
+@require_session
+def resume_session(session_id: str, session: InteractiveSession):
     """Resume a paused session."""
-    if session_id not in sessions:
-        return jsonify({"error": "Session not found"}), 404
-
-    session = sessions[session_id]
     session.resume()
 
     return jsonify({"status": "resumed"})
 
 
 @app.route('/api/session/<session_id>/human', methods=['POST'])
-def submit_human_turn(session_id: str):
+@require_session
+def submit_human_turn(session_id: str, session: InteractiveSession):
     """Submit human's contribution to the dialogue."""
-    if session_id not in sessions:
-        return jsonify({"error": "Session not found"}), 404
-
     data = request.get_json() or {}
     content = data.get('content', '').strip()
 
     if not content:
         return jsonify({"error": "Content is required"}), 400
 
-    session = sessions[session_id]
-
     # Submit the turn
     turn_event = session.submit_human_turn(content)
 
@@ -539,40 +781,34 @@ def submit_human_turn(session_id: str):
 
 
 @app.route('/api/session/<session_id>/invoke', methods=['POST'])
-def invoke_agent(session_id: str):
+@require_session
+def invoke_agent(session_id: str, session: InteractiveSession):
     """Request a specific agent to speak next."""
-    if session_id not in sessions:
-        return jsonify({"error": "Session not found"}), 404
-
     data = request.get_json() or {}
     agent_id = data.get('agent_id', '').strip()
 
     if not agent_id:
         return jsonify({"error": "agent_id is required"}), 400
 
-    session = sessions[session_id]
     session.invoke_agent(agent_id)
 
     return jsonify({"status": "invoked", "agent_id": agent_id})
 
 
 @app.route('/api/session/<session_id>/inject', methods=['POST'])
-def inject_prompt(session_id: str):
+@require_session
+def inject_prompt(session_id: str, session: InteractiveSession):
     """Inject a researcher prompt into the dialogue context.
 
     This adds a prompt that agents will see but does NOT count as a turn.
     Useful for researcher interventions like "Challenge this" or "Ask Luma".
     """
-    if session_id not in sessions:
-        return jsonify({"error": "Session not found"}), 404
-
     data = request.get_json() or {}
     content = data.get('content', '').strip()
 
     if not content:
         return jsonify({"error": "content is required"}), 400
 
-    session = sessions[session_id]
     session.inject_prompt(content)
 
     return jsonify({
@@ -583,33 +819,35 @@ def inject_prompt(session_id: str):
 
 
 @app.route('/api/session/<session_id>/continue', methods=['POST'])
-def continue_session(session_id: str):
+@require_session
+def continue_session(session_id: str, session: InteractiveSession):
     """Continue the dialogue without human input.
 
     Used when it's the human's turn but they want to skip and let
     the AI agents continue the conversation.
     """
-    if session_id not in sessions:
-        return jsonify({"error": "Session not found"}), 404
-
-    session = sessions[session_id]
     session._trigger_next_response()
 
     return jsonify({"status": "continued"})
 
 
 @app.route('/api/session/<session_id>/end', methods=['POST'])
-def end_session_endpoint(session_id: str):
+@require_session
+def end_session_endpoint(session_id: str, session: InteractiveSession):
     """End a session, run analysis, and save results."""
-    if session_id not in sessions:
-        return jsonify({"error": "Session not found"}), 404
-
-    session = sessions[session_id]
     path = session.end_session()
 
     # Clean up session from store
     del sessions[session_id]
 
+    # Pre-generate the dialogue view served by the history endpoints
+    checkpoint_path = session_file(session_id, _CHECKPOINT_SUFFIX)
+    if os.path.exists(checkpoint_path):
+        try:
+            write_dialogue_file(session_id, checkpoint_path)
+        except Exception as e:
+            print(f"Dialogue export failed: {e}")
+
     # Run post-hoc analysis if session was saved
     analysis_result = None
     analysis_path = None
@@ -619,12 +857,12 @@ def end_session_endpoint(session_id: str):
             result = analyze_session(path, compute_embeddings=True)
             analysis_result = result.to_dict()
 
-            # Save analysis to separate file
-            analysis_path = path.with_name(
-                path.stem.replace('_checkpoint', '_analysis') + '.json'
-            )
-            with open(analysis_path, 'w') as f:
-                json.dump(analysis_result, f, indent=2)
+            # Save analysis to separate file (the name the history endpoints look up)
+            analysis_path = session_file(session_id, _ANALYSIS_SUFFIX)
+            write_json_atomic(analysis_path, analysis_result)
+            append_session_index(SESSIONS_DIR, {
+                'session_id': session_id, 'analysis': analysis_path
+            })
 
         except Exception as e:
             print(f"Analysis failed: {e}")
@@ -633,7 +871,7 @@ def end_session_endpoint(session_id: str):
     return jsonify({
         "status": "ended",
         "saved_to": str(path) if path else None,
-        "analysis_path": str(analysis_path) if analysis_path else None,
+        "analysis_path": analysis_path,
         "analysis": analysis_result
     })
 
@@ -642,38 +880,184 @@ def end_session_endpoint(session_id: str):
 # Session History & Analysis Endpoints
 # ============================================================================
 
-@app.route('/api/sessions', methods=['GET'])
-def list_sessions():
-    """List all saved sessions with analysis status."""
-    sessions_list = []
+def read_checkpoint_head(checkpoint: str) -> dict:
+    """Read list metadata from a checkpoint without materializing its turns.
+
+    Streams parse events and stops as soon as the provocation, start time
+    and turn count are known. Checkpoints written with a top-level
+    ``n_turns`` stop before ``turns``; older ones count turns as they pass.
+    The pre-truncated ``provocation_preview`` is used when present.
+    Falls back to a full parse when ijson is unavailable or fails.
+
+    For a checkpoint log the header line has the session fields and every
+    further complete line is one turn.
+    """
+    if checkpoint.endswith(_CHECKPOINT_LOG_SUFFIX):
+        with open(checkpoint, 'rb') as f:
+            header = json_loads(f.readline())
+            n_turns = sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 20), b''))
+        return {
+            'provocation': header.get('provocation_preview') or (
+                header.get('provocation_text', '')[:PROVOCATION_PREVIEW_CHARS]
+            ),
+            'n_turns': n_turns,
+            'timestamp': header.get('start_time', '')
+        }
+
+    if IJSON_AVAILABLE:
+        provocation = None
+        timestamp = None
+        n_turns = None
+        counted = 0
+        try:
+            with open(checkpoint, 'rb') as f:
+                for prefix, event, value in ijson.parse(f):
+                    if event == 'string' and prefix == 'provocation_preview':
+                        provocation = value
+                    elif (event == 'string' and provocation is None
+                          and prefix in ('provocation', 'provocation_text')):
+                        provocation = value[:PROVOCATION_PREVIEW_CHARS]
+                    elif event == 'string' and prefix == 'start_time':
+                        timestamp = value
+                    elif event == 'number' and prefix == 'n_turns':
+                        n_turns = int(value)
+                    elif event == 'start_map' and prefix == 'turns.item':
+                        counted += 1
+                    elif event == 'end_array' and prefix == 'turns' and n_turns is None:
+                        n_turns = counted
+
+                    if provocation is not None and timestamp is not None and n_turns is not None:
+                        break
+            return {
+                'provocation': provocation or '',
+                'n_turns': n_turns if n_turns is not None else counted,
+                'timestamp': timestamp or ''
+            }
+        except ijson.JSONError:
+            pass
+
+    with open(checkpoint, 'rb') as f:
+        data = json_loads(f.read())
+    return {
+        'provocation': data.get('provocation_preview') or (
+            data.get('provocation') or data.get('provocation_text', '')
+        )[:PROVOCATION_PREVIEW_CHARS],
+        'n_turns': data.get('n_turns', len(data.get('turns', []))),
+        'timestamp': data.get('start_time', '')
+    }
+
+
+def get_checkpoint_meta(checkpoint: str, st: os.stat_result) -> dict:
+    """Get list metadata for a checkpoint, re-parsing only when it changes.
+
+    The cached entry is reused while the file's mtime and size match.
+    """
+    cached = _session_meta_cache.get(checkpoint)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    try:
+        meta = read_checkpoint_head(checkpoint)
+    except Exception:
+        meta = {'provocation': '', 'n_turns': 0, 'timestamp': ''}
+
+    _session_meta_cache[checkpoint] = (st.st_mtime_ns, st.st_size, meta)
+    return meta
 
-    for checkpoint in sorted(SESSIONS_DIR.glob('*_checkpoint.json'), reverse=True):
-        # Extract just the timestamp part (e.g., "20260115_141851" from "session_20260115_141851_checkpoint")
-        session_id = checkpoint.stem.replace('_checkpoint', '').replace('session_', '')
-        analysis_path = checkpoint.with_name(
-            checkpoint.stem.replace('_checkpoint', '_analysis') + '.json'
-        )
+
+def scan_sessions_dir() -> list:
+    """Build session index entries by scanning SESSIONS_DIR for checkpoints."""
+    index_entries = []
+    seen = set()
+
+    # One directory pass: DirEntry carries the name and a cached stat, and
+    # the name set answers the analysis-file check without extra syscalls
+    try:
+        with os.scandir(SESSIONS_DIR) as it:
+            entries = {entry.name: entry for entry in it}
+    except FileNotFoundError:
+        entries = {}
+
+    for name in entries:
+        if not name.startswith(_SESSION_PREFIX):
+            continue
+        if name.endswith(_CHECKPOINT_SUFFIX):
+            suffix = _CHECKPOINT_SUFFIX
+        elif name.endswith(_CHECKPOINT_LOG_SUFFIX):
+            suffix = _CHECKPOINT_LOG_SUFFIX
+        else:
+            continue
+        entry = entries[name]
+        # Extract just the timestamp part (e.g., "20260115_141851" from "session_20260115_141851_checkpoint.json")
+        session_id = name[len(_SESSION_PREFIX):-len(suffix)]
+        if (suffix == _CHECKPOINT_LOG_SUFFIX
+                and _SESSION_PREFIX + session_id + _CHECKPOINT_SUFFIX in entries):
+            continue  # Consolidated while the directory was being read
+        analysis_name = _SESSION_PREFIX + session_id + _ANALYSIS_SUFFIX
 
         # Get basic info from checkpoint
         try:
-            with open(checkpoint) as f:
-                data = json.load(f)
-                provocation = data.get('provocation', '')[:100]
-                n_turns = len(data.get('turns', []))
-                timestamp = data.get('start_time', '')
-        except Exception:
-            provocation = ''
-            n_turns = 0
-            timestamp = ''
+            st = entry.stat()
+            meta = get_checkpoint_meta(entry.path, st)
+        except OSError:
+            continue  # Removed since the directory scan
+        seen.add(entry.path)
 
-        sessions_list.append({
+        index_entries.append({
             'session_id': session_id,
-            'checkpoint_path': str(checkpoint),
-            'has_analysis': analysis_path.exists(),
-            'analysis_path': str(analysis_path) if analysis_path.exists() else None,
-            'provocation': provocation,
-            'n_turns': n_turns,
-            'timestamp': timestamp
+            'checkpoint': entry.path,
+            'analysis': (
+                os.path.join(SESSIONS_DIR, analysis_name)
+                if analysis_name in entries else None
+            ),
+            'provocation': meta['provocation'],
+            'n_turns': meta['n_turns'],
+            'start_time': meta['timestamp'],
+            'mtime': st.st_mtime
+        })
+
+    # Drop cache entries for checkpoints that no longer exist
+    for stale in _session_meta_cache.keys() - seen:
+        del _session_meta_cache[stale]
+
+    return index_entries
+
+
+@app.route('/api/sessions', methods=['GET'])
+def list_sessions():
+    """List all saved sessions with analysis status.
+
+    Served from the session index, which the session logger and the
+    analysis writes keep current. Entries whose checkpoint has gone
+    trigger a rescan and index rebuild; pass ``?rescan=1`` to pick up
+    sessions written without the index.
+    """
+    index = None
+    if request.args.get('rescan') != '1':
+        index = load_session_index(SESSIONS_DIR)
+
+    entries = None
+    if index is not None:
+        entries = [e for e in index.values() if e.get('checkpoint')]
+        if not all(os.path.exists(e['checkpoint']) for e in entries):
+            entries = None  # Removed by other means: the index is stale
+
+    if entries is None:
+        entries = scan_sessions_dir()
+        if entries:
+            write_session_index(SESSIONS_DIR, entries)
+
+    sessions_list = []
+    for entry in sorted(entries, key=lambda e: e['session_id'], reverse=True):
+        analysis_path = entry.get('analysis')
+        sessions_list.append({
+            'session_id': entry['session_id'],
+            'checkpoint_path': entry['checkpoint'],
+            'has_analysis': analysis_path is not None,
+            'analysis_path': analysis_path,
+            'provocation': entry.get('provocation', ''),
+            'n_turns': entry.get('n_turns', 0),
+            'timestamp': entry.get('start_time', '')
         })
 
     return jsonify({'sessions': sessions_list})
@@ -681,14 +1065,19 @@ def list_sessions():
 
 @app.route('/api/sessions/<session_id>/analysis', methods=['GET'])
 def get_session_analysis(session_id: str):
-    """Get analysis for a specific session."""
+    """Get analysis for a specific session.
+
+    Analyses are stored compact; pass ``?pretty=1`` for indented output.
+    """
+    pretty = request.args.get('pretty') == '1'
+
     # Find the analysis file
-    analysis_path = SESSIONS_DIR / f'session_{session_id}_analysis.json'
+    analysis_path = session_file(session_id, _ANALYSIS_SUFFIX)
 
-    if not analysis_path.exists():
+    if not os.path.exists(analysis_path):
         # Try to run analysis on the checkpoint
-        checkpoint_path = SESSIONS_DIR / f'session_{session_id}_checkpoint.json'
-        if not checkpoint_path.exists():
+        checkpoint_path = find_checkpoint(session_id)
+        if checkpoint_path is None:
             return jsonify({"error": "Session not found"}), 404
 
         try:
@@ -696,37 +1085,119 @@ def get_session_analysis(session_id: str):
             analysis_result = result.to_dict()
 
             # Save for future requests
-            with open(analysis_path, 'w') as f:
-                json.dump(analysis_result, f, indent=2)
-
+            write_json_atomic(analysis_path, analysis_result)
+            append_session_index(SESSIONS_DIR, {
+                'session_id': session_id, 'analysis': analysis_path
+            })
+
+            if pretty:
+                return Response(json_dumps(analysis_result, indent=True),
+                                mimetype='application/json')
             return jsonify(analysis_result)
 
         except Exception as e:
             return jsonify({"error": f"Analysis failed: {str(e)}"}), 500
 
-    # Load existing analysis
-    with open(analysis_path) as f:
-        return jsonify(json.load(f))
+    if pretty:
+        with open(analysis_path, 'rb') as f:
+            return Response(json_dumps(json_loads(f.read()), indent=True),
+                            mimetype='application/json')
+
+    # Serve existing analysis as-is (ETag/Last-Modified enable 304 revalidation)
+    return send_file(analysis_path, mimetype='application/json', conditional=True)
+
+
+def write_dialogue_file(session_id: str, checkpoint_path: str) -> str:
+    """Write the dialogue view of a checkpoint so it can be served directly.
+
+    The dialogue endpoint returns a reshaped subset of the checkpoint, so
+    the reshaped JSON is generated once here rather than on every request.
+    With ijson the turns are copied across one at a time, so the whole
+    checkpoint is never held in memory.
+
+    Returns:
+        Path to the written dialogue file
+    """
+    dialogue_path = session_file(session_id, _DIALOGUE_SUFFIX)
+
+    if not IJSON_AVAILABLE or checkpoint_path.endswith(_CHECKPOINT_LOG_SUFFIX):
+        data = load_checkpoint(checkpoint_path)
+
+        write_json_atomic(dialogue_path, {
+            'session_id': session_id,
+            'provocation': data.get('provocation') or data.get('provocation_text', ''),
+            'turns': data.get('turns', []),
+            'start_time': data.get('start_time', ''),
+            'end_time': data.get('end_time', '')
+        })
+        return dialogue_path
+
+    fields = {}
+    # Unique temp file per writer: concurrent requests for a stale dialogue
+    # file must not share (and truncate) one temp path
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(dialogue_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as out, open(checkpoint_path, 'rb') as src:
+            out.write(b'{"turns":[')
+            builder = None
+            sep = b''
+            for prefix, event, value in ijson.parse(src, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if event == 'end_map' and prefix == 'turns.item':
+                        out.write(sep + json_dumps(builder.value))
+                        sep = b','
+                        builder = None
+                elif event == 'start_map' and prefix == 'turns.item':
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                elif prefix in ('provocation', 'provocation_text', 'start_time', 'end_time'):
+                    fields[prefix] = value
+
+            # Remaining fields go after the turns; key order is not significant
+            out.write(b'],' + json_dumps({
+                'session_id': session_id,
+                'provocation': fields.get('provocation') or fields.get('provocation_text') or '',
+                'start_time': fields.get('start_time', ''),
+                'end_time': fields.get('end_time', '')
+            })[1:])
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp_path, dialogue_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+    return dialogue_path
 
 
 @app.route('/api/sessions/<session_id>/dialogue', methods=['GET'])
 def get_session_dialogue(session_id: str):
     """Get full dialogue content for a session."""
-    checkpoint_path = SESSIONS_DIR / f'session_{session_id}_checkpoint.json'
-
-    if not checkpoint_path.exists():
+    # One stat per file: existence and freshness come from the same call
+    for suffix in (_CHECKPOINT_SUFFIX, _CHECKPOINT_LOG_SUFFIX):
+        checkpoint_path = session_file(session_id, suffix)
+        try:
+            checkpoint_mtime = os.stat(checkpoint_path).st_mtime_ns
+            break
+        except FileNotFoundError:
+            continue
+    else:
         return jsonify({"error": "Session not found"}), 404
 
-    with open(checkpoint_path) as f:
-        data = json.load(f)
+    # Regenerate only if the checkpoint has been written since (or never generated)
+    dialogue_path = session_file(session_id, _DIALOGUE_SUFFIX)
+    try:
+        stale = os.stat(dialogue_path).st_mtime_ns < checkpoint_mtime
+    except FileNotFoundError:
+        stale = True
+    if stale:
+        dialogue_path = write_dialogue_file(session_id, checkpoint_path)
 
-    return jsonify({
-        'session_id': session_id,
-        'provocation': data.get('provocation', ''),
-        'turns': data.get('turns', []),
-        'start_time': data.get('start_time', ''),
-        'end_time': data.get('end_time', '')
-    })
+    return send_file(dialogue_path, mimetype='application/json', conditional=True)
 
 
 # ============================================================================
@@ -20,30 +20,36 @@ Usage:
         print(f"Basin: {state['basin']}, Integrity: {state.trajectory_integrity}")
 """
 
-import json
+import hashlib
+import os
 import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, fields
+from typing import Callable, List, Dict, Any, Optional, Tuple
 
 # Handle both package and direct execution
 try:
     from .metrics import (
-        compute_metrics,
         compute_metrics_with_ci,
+        StreamingMetrics,
         semantic_curvature,
         dfa_alpha,
         entropy_shift,
         semantic_velocity,
+        MetricsResult,
         MetricsResultWithCI,
-        THRESHOLDS
+        THRESHOLDS,
+        _resolve_n_jobs
     )
     from .basins import (
         BasinDetector,
         BasinHistory,
         DialogueContext,
         compute_psi_vector,
-        compute_dialogue_context
+        DialogueState
     )
     from .affective import (
         compute_affective_substrate,
@@ -60,23 +66,27 @@ try:
         TransformationDetector,
         IntegrityResult
     )
+    from .jsonio import json_dumps
+    from .session_logger import decode_embedding, iter_session, load_checkpoint
 except ImportError:
     from metrics import (
-        compute_metrics,
         compute_metrics_with_ci,
+        StreamingMetrics,
         semantic_curvature,
         dfa_alpha,
         entropy_shift,
         semantic_velocity,
+        MetricsResult,
         MetricsResultWithCI,
-        THRESHOLDS
+        THRESHOLDS,
+        _resolve_n_jobs
     )
     from basins import (
         BasinDetector,
         BasinHistory,
         DialogueContext,
         compute_psi_vector,
-        compute_dialogue_context
+        DialogueState
     )
     from affective import (
         compute_affective_substrate,
@@ -93,9 +103,28 @@ except ImportError:
         TransformationDetector,
         IntegrityResult
     )
+    from jsonio import json_dumps
+    from session_logger import decode_embedding, iter_session, load_checkpoint
 
 import re
 
+try:
+    from ._session_kernels import psi_derivatives
+except ImportError:
+    from _session_kernels import psi_derivatives
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    from threadpoolctl import threadpool_limits
+    THREADPOOLCTL_AVAILABLE = True
+except ImportError:
+    THREADPOOLCTL_AVAILABLE = False
+
 
 # =============================================================================
 # Dialectical Analysis Functions
@@ -258,7 +287,18 @@ def compute_antithesis_ratio(turn_type_dist: Dict[str, int]) -> float:
     return antithesis_count / total
 
 
-@dataclass
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """Dataclass field names of cls, looked up once per class."""
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(cls))
+    return names
+
+
+@dataclass(slots=True)
 class TurnState:
     """State snapshot for a single turn."""
     turn_number: int
@@ -276,7 +316,171 @@ class TurnState:
     trajectory_curvature: Optional[float] = None
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            'turn_number': self.turn_number,
+            'agent_id': self.agent_id,
+            'basin': self.basin,
+            'basin_confidence': self.basin_confidence,
+            'psi_semantic': self.psi_semantic,
+            'psi_temporal': self.psi_temporal,
+            'psi_affective': self.psi_affective,
+            'coherence_pattern': self.coherence_pattern,
+            'residence_time': self.residence_time,
+            'velocity_magnitude': self.velocity_magnitude,
+            'acceleration_magnitude': self.acceleration_magnitude,
+            'trajectory_curvature': self.trajectory_curvature
+        }
+
+
+class TurnStateColumns:
+    """
+    Column-oriented storage for per-turn states.
+
+    Numeric fields live in parallel preallocated arrays (NaN marks an
+    unavailable optional value) and string labels are stored as small-int
+    codes, so session aggregates are single array reductions. TurnState
+    objects are materialized on request and cached, since rows never change
+    once written.
+    """
+
+    FLOAT_FIELDS = (
+        'basin_confidence', 'psi_semantic', 'psi_temporal', 'psi_affective',
+        'velocity_magnitude', 'acceleration_magnitude', 'trajectory_curvature'
+    )
+    INT_FIELDS = ('turn_number', 'residence_time', 'agent', 'basin', 'coherence_pattern')
+
+    def __init__(self, capacity: int = 64):
+        """
+        Args:
+            capacity: Initial number of rows (grows by doubling)
+        """
+        self.n = 0
+        self.columns: Dict[str, np.ndarray] = {}
+        for name in self.FLOAT_FIELDS:
+            self.columns[name] = np.empty(capacity, dtype=np.float64)
+        for name in self.INT_FIELDS:
+            self.columns[name] = np.empty(capacity, dtype=np.int64)
+
+        # Label <-> code tables, codes assigned in first-seen order
+        self.agent_labels: List[str] = []
+        self.basin_labels: List[str] = []
+        self.coherence_labels: List[str] = []
+        self._agent_codes: Dict[str, int] = {}
+        self._basin_codes: Dict[str, int] = {}
+        self._coherence_codes: Dict[str, int] = {}
+
+        # Running occurrence count per code, kept alongside each label table
+        self._agent_counts: List[int] = []
+        self._basin_counts: List[int] = []
+        self._coherence_counts: List[int] = []
+
+        self._rows: List[TurnState] = []
+
+    def __len__(self) -> int:
+        return self.n
+
+    @staticmethod
+    def _code(
+        label: str,
+        codes: Dict[str, int],
+        labels: List[str],
+        counts: List[int]
+    ) -> int:
+        code = codes.get(label)
+        if code is None:
+            code = codes[label] = len(labels)
+            labels.append(label)
+            counts.append(0)
+        counts[code] += 1
+        return code
+
+    def append(
+        self,
+        turn_number: int,
+        agent_id: str,
+        basin: str,
+        basin_confidence: float,
+        psi_semantic: float,
+        psi_temporal: float,
+        psi_affective: float,
+        coherence_pattern: str,
+        residence_time: int,
+        velocity_magnitude: Optional[float] = None,
+        acceleration_magnitude: Optional[float] = None,
+        trajectory_curvature: Optional[float] = None
+    ) -> None:
+        """Write one turn's fields into the next row."""
+        i = self.n
+        if i == len(self.columns['turn_number']):
+            for name, col in self.columns.items():
+                grown = np.empty(2 * len(col), dtype=col.dtype)
+                grown[:i] = col[:i]
+                self.columns[name] = grown
+
+        cols = self.columns
+        cols['turn_number'][i] = turn_number
+        cols['residence_time'][i] = residence_time
+        cols['agent'][i] = self._code(
+            agent_id, self._agent_codes, self.agent_labels, self._agent_counts
+        )
+        cols['basin'][i] = self._code(
+            basin, self._basin_codes, self.basin_labels, self._basin_counts
+        )
+        cols['coherence_pattern'][i] = self._code(
+            coherence_pattern, self._coherence_codes, self.coherence_labels,
+            self._coherence_counts
+        )
+        cols['basin_confidence'][i] = basin_confidence
+        cols['psi_semantic'][i] = psi_semantic
+        cols['psi_temporal'][i] = psi_temporal
+        cols['psi_affective'][i] = psi_affective
+        cols['velocity_magnitude'][i] = np.nan if velocity_magnitude is None else velocity_magnitude
+        cols['acceleration_magnitude'][i] = (
+            np.nan if acceleration_magnitude is None else acceleration_magnitude
+        )
+        cols['trajectory_curvature'][i] = np.nan if trajectory_curvature is None else trajectory_curvature
+        self.n += 1
+
+    def column(self, name: str) -> np.ndarray:
+        """View of the filled part of a column."""
+        return self.columns[name][:self.n]
+
+    def _optional(self, name: str, i: int) -> Optional[float]:
+        value = self.columns[name][i]
+        return None if np.isnan(value) else float(value)
+
+    def row(self, i: int) -> TurnState:
+        """Materialize row i as a TurnState."""
+        cols = self.columns
+        return TurnState(
+            turn_number=int(cols['turn_number'][i]),
+            agent_id=self.agent_labels[cols['agent'][i]],
+            basin=self.basin_labels[cols['basin'][i]],
+            basin_confidence=float(cols['basin_confidence'][i]),
+            psi_semantic=float(cols['psi_semantic'][i]),
+            psi_temporal=float(cols['psi_temporal'][i]),
+            psi_affective=float(cols['psi_affective'][i]),
+            coherence_pattern=self.coherence_labels[cols['coherence_pattern'][i]],
+            residence_time=int(cols['residence_time'][i]),
+            velocity_magnitude=self._optional('velocity_magnitude', i),
+            acceleration_magnitude=self._optional('acceleration_magnitude', i),
+            trajectory_curvature=self._optional('trajectory_curvature', i)
+        )
+
+    def rows(self) -> List[TurnState]:
+        """All rows as TurnState objects (materialized incrementally)."""
+        for i in range(len(self._rows), self.n):
+            self._rows.append(self.row(i))
+        return list(self._rows)
+
+    def label_counts(self, name: str) -> Dict[str, int]:
+        """Occurrences of each label in a coded column, in first-seen order."""
+        labels, counts = {
+            'agent': (self.agent_labels, self._agent_counts),
+            'basin': (self.basin_labels, self._basin_counts),
+            'coherence_pattern': (self.coherence_labels, self._coherence_counts)
+        }[name]
+        return dict(zip(labels, counts))
 
 
 @dataclass
@@ -351,12 +555,78 @@ class SessionAnalysisResult:
     antithesis_ratio: Optional[float] = None  # % of turns that are challenges
 
     def to_dict(self) -> dict:
-        result = asdict(self)
-        result['turn_states'] = [t.to_dict() for t in self.turn_states]
+        result = {}
+        for name in _field_names(SessionAnalysisResult):
+            value = getattr(self, name)
+            # Fields hold scalars or flat containers; copy containers one level
+            if name == 'turn_states':
+                value = [t.to_dict() for t in value]
+            elif isinstance(value, list):
+                value = list(value)
+            elif isinstance(value, dict):
+                value = dict(value)
+            result[name] = value
         return result
 
     def to_json(self, indent: int = 2) -> str:
-        return json.dumps(self.to_dict(), indent=indent)
+        return json_dumps(self.to_dict(), indent=bool(indent)).decode('utf-8')
+
+
+def _turn_hasher():
+    """128-bit hasher for prefix keys: xxh3 when installed, else BLAKE2b."""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128()
+    return hashlib.blake2b(digest_size=16)
+
+
+class PrefixCache:
+    """
+    LRU cache of per-turn analysis results keyed by dialogue prefix.
+
+    SessionAnalyzer chains a hash over every turn (agent, content, embedding
+    bytes) and the analyzer settings, so a key identifies the whole prefix
+    up to that turn. Sessions that open with the same turns, or the same
+    session analyzed again, reuse the window metrics, Ψ vector, dialogue
+    context and basin of those turns instead of recomputing them.
+
+    Share one instance between analyzers in the same process, e.g. via
+    analyze_session(prefix_cache=...).
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Args:
+            maxsize: Maximum number of turns kept
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: bytes) -> Optional[tuple]:
+        """Cached entry for key (marking it recently used), or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: bytes, entry: tuple) -> None:
+        """Store entry, evicting the least recently used beyond maxsize."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
 
 
 class SessionAnalyzer:
@@ -368,17 +638,45 @@ class SessionAnalyzer:
     - Rolling window metrics
     - Coherence pattern detection
     - Trajectory dynamics and integrity
+
+    Turns are fed one at a time through process_turn(). When the embeddings
+    are not produced live, compute them as one (n_turns, dim) batch and
+    pass rows of that array, as analyze_sessions() does. Rows already in
+    the analyzer's embedding_dtype are copied in without a conversion.
     """
 
-    def __init__(self, window_size: int = 5, trajectory_window: int = 50):
+    def __init__(
+        self,
+        window_size: int = 5,
+        trajectory_window: int = 50,
+        embedding_dtype: Optional[type] = np.float32,
+        metrics_refresh_interval: int = 1,
+        metrics_refresh_threshold: float = 0.5,
+        prefix_cache: Optional[PrefixCache] = None
+    ):
         """
         Initialize session analyzer.
 
         Args:
             window_size: Number of turns for rolling metrics
             trajectory_window: Maximum Ψ observations for trajectory buffer
+            embedding_dtype: Storage dtype for embeddings. float32 matches the
+                encoder's output precision and halves memory traffic versus
+                float64 lists loaded from JSON; np.float16 halves it again at
+                ~1e-3 relative precision. None keeps the input dtype.
+            metrics_refresh_interval: Turns between full recomputations of
+                DFA alpha and entropy shift over the history. 1 (default)
+                recomputes every turn; larger values reuse the last values
+                in between, while curvature stays exact.
+            metrics_refresh_threshold: Cosine distance from the previous
+                embedding that forces a recomputation regardless of the
+                interval
+            prefix_cache: Optional PrefixCache shared with other analyzers;
+                turns whose whole prefix was seen before (with the same
+                settings) reuse the cached results
         """
         self.window_size = window_size
+        self.embedding_dtype = embedding_dtype
         self.detector = BasinDetector()
         self.history = BasinHistory()
 
@@ -387,28 +685,107 @@ class SessionAnalyzer:
         self.integrity_analyzer = IntegrityAnalyzer()
         self.transformation_detector = TransformationDetector()
 
-        # Accumulated state
-        self.embeddings: List[np.ndarray] = []
+        # Full-history metrics, updated per embedding rather than recomputed
+        self.streaming_metrics = StreamingMetrics()
+        self.metrics_refresh_interval = metrics_refresh_interval
+        self.metrics_refresh_threshold = metrics_refresh_threshold
+        self._last_full_metrics_turn: Optional[int] = None
+
+        # Accumulated state. Embeddings live in one contiguous (capacity, dim)
+        # buffer that grows geometrically; the first _n_emb rows are valid.
+        self._emb_buf: Optional[np.ndarray] = None
+        self._n_emb = 0
         self.texts: List[str] = []
         self.agents: List[str] = []
-        self.turn_states: List[TurnState] = []
+        self.states = TurnStateColumns()
         self.window_metrics: List[dict] = []
 
+        # Per-turn text/agent/embedding features behind Ψ_affective and the
+        # dialogue context, so process_turn does not rescan earlier turns
+        self.dialogue_state = DialogueState()
+
+        # Dialogue context from the latest process_turn (full history)
+        self._last_ctx: Optional[DialogueContext] = None
+
+        # get_summary parts that depend only on the turns so far, keyed by
+        # name -> (turn count when computed, value)
+        self._summary_cache: Dict[str, Tuple[int, Any]] = {}
+
+        # Rolling hash of the turns so far, seeded with the settings that
+        # affect per-turn results
+        self.prefix_cache = prefix_cache
+        hasher = _turn_hasher()
+        hasher.update(repr((
+            window_size, trajectory_window, np.dtype(embedding_dtype).str if embedding_dtype else None,
+            metrics_refresh_interval, metrics_refresh_threshold, self.streaming_metrics.seed
+        )).encode())
+        self._prefix_seed = hasher.digest()
+        self._prefix_key = self._prefix_seed
+
+    @property
+    def turn_states(self) -> List[TurnState]:
+        """Per-turn states as TurnState objects."""
+        return self.states.rows()
+
+    @property
+    def embeddings(self) -> np.ndarray:
+        """Embeddings seen so far as an (n, dim) view (no copy)."""
+        if self._emb_buf is None:
+            return np.empty((0, 0))
+        return self._emb_buf[:self._n_emb]
+
+    def _append_embedding(self, embedding: np.ndarray) -> None:
+        """Append one embedding row, doubling the buffer when full."""
+        embedding = np.asarray(embedding)
+        if self._emb_buf is None:
+            dtype = self.embedding_dtype or embedding.dtype
+            self._emb_buf = np.empty((64, embedding.shape[-1]), dtype=dtype)
+        elif self._n_emb == len(self._emb_buf):
+            grown = np.empty((2 * len(self._emb_buf), self._emb_buf.shape[1]),
+                             dtype=self._emb_buf.dtype)
+            grown[:self._n_emb] = self._emb_buf
+            self._emb_buf = grown
+        self._emb_buf[self._n_emb] = embedding
+        self._n_emb += 1
+
     def reset(self) -> None:
         """Reset analyzer state for new session."""
         self.history.clear()
         self.trajectory.clear()
-        self.embeddings = []
+        self.streaming_metrics.reset()
+        self._last_full_metrics_turn = None
+        self._emb_buf = None
+        self._n_emb = 0
         self.texts = []
         self.agents = []
-        self.turn_states = []
+        self.states = TurnStateColumns()
         self.window_metrics = []
+        self.dialogue_state.clear()
+        self._last_ctx = None
+        self._summary_cache = {}
+        self._prefix_key = self._prefix_seed
+
+    def _cached(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return compute(), memoized until the next process_turn.
+
+        Lets get_summary be polled repeatedly during a live session without
+        redoing the full-history text and trajectory passes each time.
+        """
+        n = len(self.texts)
+        hit = self._summary_cache.get(key)
+        if hit is not None and hit[0] == n:
+            return hit[1]
+        value = compute()
+        self._summary_cache[key] = (n, value)
+        return value
 
     def process_turn(
         self,
         content: str,
         agent_id: str,
-        embedding: np.ndarray = None
+        embedding: np.ndarray = None,
+        embedding_hash: Optional[str] = None
     ) -> TurnState:
         """
         Process a single turn and return state snapshot.
@@ -417,6 +794,10 @@ class SessionAnalyzer:
             content: Turn text content
             agent_id: Agent ID
             embedding: Optional embedding vector
+            embedding_hash: Optional embedding_checksum() of the embedding's
+                float32 values (as recorded by SessionLogger). Used in place
+                of hashing the vector for the prefix cache key when the
+                analyzer stores float32.
 
         Returns:
             TurnState for this turn
@@ -427,22 +808,106 @@ class SessionAnalyzer:
         self.texts.append(content)
         self.agents.append(agent_id)
         if embedding is not None:
-            self.embeddings.append(np.array(embedding))
+            self._append_embedding(embedding)
+            row = self._emb_buf[self._n_emb - 1]
+            # One norm and cosine velocity per turn, shared by both trackers
+            self.streaming_metrics.update(row)
+            self.dialogue_state.update(
+                content, agent_id, row,
+                norm=self.streaming_metrics.last_norm,
+                velocity=self.streaming_metrics.last_velocity
+            )
+        else:
+            self.dialogue_state.update(content, agent_id)
+        n_emb = self._n_emb
+
+        # Reuse results for a prefix seen before, else compute and cache them
+        cached = None
+        if self.prefix_cache is not None:
+            self._prefix_key = self._extend_prefix_key(
+                content, agent_id,
+                self._emb_buf[n_emb - 1] if embedding is not None else None,
+                embedding_hash
+            )
+            cached = self.prefix_cache.get(self._prefix_key)
+
+        if cached is None:
+            cached = self._analyze_turn(turn_number, n_emb)
+            if self.prefix_cache is not None:
+                self.prefix_cache.put(self._prefix_key, cached)
+        else:
+            window_entry, metrics_result, last_full_turn = cached[:3]
+            if window_entry is not None:
+                self.window_metrics.append(window_entry)
+            if metrics_result is not None:
+                self.streaming_metrics.last_result = metrics_result
+            self._last_full_metrics_turn = last_full_turn
+
+        psi, ctx, basin, confidence, meta = cached[3:]
+        self._last_ctx = ctx
+
+        # Record in history
+        self.history.append(basin, confidence, turn=turn_number)
+
+        # Track Ψ in trajectory buffer
+        self.trajectory.append_values(
+            psi['psi_semantic'],
+            psi['psi_temporal'],
+            psi['psi_affective']
+        )
+
+        # Compute trajectory dynamics
+        speed, acceleration, curvature = self._trajectory_dynamics()
+
+        # Record turn state
+        self.states.append(
+            turn_number=turn_number,
+            agent_id=agent_id,
+            basin=basin,
+            basin_confidence=confidence,
+            psi_semantic=psi['psi_semantic'],
+            psi_temporal=psi['psi_temporal'],
+            psi_affective=psi['psi_affective'],
+            coherence_pattern=ctx.coherence_pattern,
+            residence_time=meta['residence_time'],
+            velocity_magnitude=speed,
+            acceleration_magnitude=acceleration,
+            trajectory_curvature=curvature
+        )
+
+        return self.states.row(len(self.states) - 1)
+
+    def _analyze_turn(self, turn_number: int, n_emb: int) -> tuple:
+        """
+        Metrics, Ψ vector, dialogue context and basin for the current turn.
 
-        # Compute window metrics if enough data
-        if len(self.embeddings) >= self.window_size:
-            window_embs = np.array(self.embeddings[-self.window_size:])
-            window_result = compute_metrics(window_embs)
-            self.window_metrics.append({
+        Appends to window_metrics and advances the streaming metrics.
+
+        Returns:
+            Tuple of (window metrics entry or None, MetricsResult or None,
+            last full metrics turn, psi, ctx, basin, confidence, meta), the
+            form stored in the prefix cache
+        """
+        # Compute window metrics if enough data (slices are views of the
+        # buffer; velocities and curvatures come from the streaming state)
+        window_entry = None
+        if n_emb >= self.window_size:
+            window_embs = self._emb_buf[n_emb - self.window_size:n_emb]
+            window_result = self.streaming_metrics.compute_window(window_embs)
+            window_entry = {
                 'delta_kappa': window_result.semantic_curvature,
                 'delta_h': window_result.entropy_shift,
                 'alpha': window_result.dfa_alpha
-            })
+            }
+            self.window_metrics.append(window_entry)
 
         # Compute current metrics (use full history or window)
-        if len(self.embeddings) >= 4:
-            embs = np.array(self.embeddings)
-            metrics_result = compute_metrics(embs)
+        metrics_result = None
+        if n_emb >= 4:
+            metrics_result = self.streaming_metrics.compute(
+                self._emb_buf[:n_emb],
+                refresh=self._metrics_refresh_due(turn_number)
+            )
             metrics = {
                 'delta_kappa': metrics_result.semantic_curvature,
                 'delta_h': metrics_result.entropy_shift,
@@ -454,16 +919,13 @@ class SessionAnalyzer:
         # Compute Psi vector
         psi = compute_psi_vector(
             metrics,
-            turn_texts=self.texts,
-            window_metrics=self.window_metrics if self.window_metrics else None
+            window_metrics=self.window_metrics if self.window_metrics else None,
+            affective=self.dialogue_state.affective()
         )
 
         # Compute dialogue context
-        ctx = compute_dialogue_context(
-            turn_texts=self.texts,
-            turn_agents=self.agents,
-            window_metrics=self.window_metrics if self.window_metrics else None,
-            embeddings=np.array(self.embeddings) if len(self.embeddings) >= 2 else None
+        ctx = self.dialogue_state.context(
+            window_metrics=self.window_metrics if self.window_metrics else None
         )
 
         # Detect basin
@@ -474,42 +936,95 @@ class SessionAnalyzer:
             basin_history=self.history
         )
 
-        # Record in history
-        self.history.append(basin, confidence, turn=turn_number)
+        return (window_entry, metrics_result, self._last_full_metrics_turn,
+                psi, ctx, basin, confidence, meta)
 
-        # Track Ψ in trajectory buffer
-        self.trajectory.append({
-            'psi_semantic': psi['psi_semantic'],
-            'psi_temporal': psi['psi_temporal'],
-            'psi_affective': psi['psi_affective']
-        })
+    def _extend_prefix_key(
+        self,
+        content: str,
+        agent_id: str,
+        embedding: Optional[np.ndarray],
+        embedding_hash: Optional[str] = None
+    ) -> bytes:
+        """Chain one turn onto the rolling prefix hash."""
+        hasher = _turn_hasher()
+        hasher.update(self._prefix_key)
+        for part in (agent_id.encode(), content.encode()):
+            hasher.update(len(part).to_bytes(8, 'little'))
+            hasher.update(part)
+        if embedding is None:
+            hasher.update(b'\x00')
+        elif embedding_hash is not None and embedding.dtype == np.float32:
+            # The checksum identifies the float32 vector, so it stands in
+            # for the bytes
+            hasher.update(b'\x02' + embedding_hash.encode())
+        else:
+            hasher.update(b'\x01' + embedding.dtype.str.encode())
+            hasher.update(np.ascontiguousarray(embedding).tobytes())
+        return hasher.digest()
 
-        # Compute trajectory dynamics
-        trajectory_deriv = compute_trajectory_derivatives(self.trajectory)
+    def metrics_from_state(self) -> Optional[MetricsResult]:
+        """
+        Full-history metrics from the incremental state, without a pass over
+        the stored embeddings.
 
-        # Create turn state
-        state = TurnState(
-            turn_number=turn_number,
-            agent_id=agent_id,
-            basin=basin,
-            basin_confidence=confidence,
-            psi_semantic=psi['psi_semantic'],
-            psi_temporal=psi['psi_temporal'],
-            psi_affective=psi['psi_affective'],
-            coherence_pattern=ctx.coherence_pattern,
-            residence_time=meta['residence_time'],
-            velocity_magnitude=trajectory_deriv['speed'],
-            acceleration_magnitude=self.trajectory.compute_acceleration_magnitude(),
-            trajectory_curvature=trajectory_deriv['curvature']
+        Returns:
+            MetricsResult as of the last process_turn (DFA alpha and entropy
+            shift from the most recent refresh), or None before four
+            embeddings have been seen
+        """
+        return self.streaming_metrics.last_result
+
+    def _metrics_refresh_due(self, turn_number: int) -> bool:
+        """
+        Whether this turn recomputes DFA alpha and entropy shift in full.
+
+        Args:
+            turn_number: Index of the turn being processed
+
+        Returns:
+            True every metrics_refresh_interval turns, or when the latest
+            embedding moved more than metrics_refresh_threshold
+        """
+        due = (
+            self._last_full_metrics_turn is None
+            or turn_number - self._last_full_metrics_turn >= self.metrics_refresh_interval
+            or self.streaming_metrics.last_velocity > self.metrics_refresh_threshold
+        )
+        if due:
+            self._last_full_metrics_turn = turn_number
+        return due
+
+    def _trajectory_dynamics(self) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        """
+        Speed, acceleration magnitude and curvature at the latest Ψ point.
+
+        Uses the psi_derivatives kernel on the last three observations;
+        same values as compute_trajectory_derivatives() plus
+        compute_acceleration_magnitude().
+
+        Returns:
+            Tuple of (speed, acceleration, curvature), None where undefined
+        """
+        if len(self.trajectory) < 3:
+            return None, None, None
+
+        speed, acceleration, curvature = psi_derivatives(
+            self.trajectory.psi_array[-3:],
+            self.trajectory.timestamps[-3:]
         )
-        self.turn_states.append(state)
 
-        return state
+        return (
+            None if np.isnan(speed) else float(speed),
+            None if np.isnan(acceleration) else float(acceleration),
+            None if np.isnan(curvature) else float(curvature)
+        )
 
     def get_summary(
         self,
         compute_ci: bool = False,
-        bootstrap_iterations: int = 300
+        bootstrap_iterations: int = 300,
+        n_jobs: int = 1
     ) -> SessionAnalysisResult:
         """
         Get summary analysis for accumulated session.
@@ -517,6 +1032,8 @@ class SessionAnalyzer:
         Args:
             compute_ci: If True, compute bootstrap confidence intervals (slower)
             bootstrap_iterations: Number of bootstrap samples for CI
+            n_jobs: Worker processes for the bootstrap (-1 = all CPUs);
+                does not change the results
 
         Returns:
             SessionAnalysisResult with full analysis
@@ -533,14 +1050,15 @@ class SessionAnalyzer:
         entropy_significant = None
 
         # Compute full-session metrics
-        if len(self.embeddings) >= 4:
-            embs = np.array(self.embeddings)
+        if self._n_emb >= 4:
+            embs = self.embeddings
 
             if compute_ci:
                 # Use enhanced metrics with CI
                 metrics_ci = compute_metrics_with_ci(
                     embs,
-                    bootstrap_iterations=bootstrap_iterations
+                    bootstrap_iterations=bootstrap_iterations,
+                    n_jobs=n_jobs
                 )
                 sc = metrics_ci.semantic_curvature
                 alpha = metrics_ci.dfa_alpha
@@ -559,7 +1077,7 @@ class SessionAnalyzer:
                 entropy_significant = metrics_ci.entropy_significant
             else:
                 # Fast path: basic metrics only
-                metrics = compute_metrics(embs)
+                metrics = self._cached('metrics', lambda: self.streaming_metrics.compute(embs))
                 sc = metrics.semantic_curvature
                 alpha = metrics.dfa_alpha
                 delta_h = metrics.entropy_shift
@@ -575,17 +1093,14 @@ class SessionAnalyzer:
         basin_seq = self.history.get_basin_sequence()
 
         if basin_dist:
-            dominant = max(basin_dist, key=basin_dist.get)
-            dominant_pct = basin_dist[dominant] / len(basin_seq)
+            dominant, dominant_count = max(basin_dist.items(), key=itemgetter(1))
+            dominant_pct = dominant_count / len(basin_seq)
         else:
             dominant = 'Transitional'
             dominant_pct = 0.0
 
         # Coherence pattern distribution
-        coherence_dist = {}
-        for state in self.turn_states:
-            pattern = state.coherence_pattern
-            coherence_dist[pattern] = coherence_dist.get(pattern, 0) + 1
+        coherence_dist = self.states.label_counts('coherence_pattern')
 
         # Inquiry vs Mimicry ratio
         inquiry_count = basin_dist.get('Collaborative Inquiry', 0)
@@ -593,14 +1108,9 @@ class SessionAnalyzer:
         total_eval = inquiry_count + mimicry_count
         inquiry_ratio = inquiry_count / total_eval if total_eval > 0 else 0.5
 
-        # Voice distinctiveness (final value)
-        voice_dist = 0.0
-        if len(self.embeddings) >= 2:
-            ctx = compute_dialogue_context(
-                self.texts, self.agents,
-                embeddings=np.array(self.embeddings)
-            )
-            voice_dist = ctx.voice_distinctiveness
+        # Voice distinctiveness (final value). The last process_turn already
+        # computed it over the same texts, agents and embeddings.
+        voice_dist = self._last_ctx.voice_distinctiveness if self._last_ctx else 0.0
 
         # Affective analysis (using enhanced module)
         psi_affective = None
@@ -611,35 +1121,58 @@ class SessionAnalyzer:
         agent_divergence = None
 
         if self.texts:
-            affective_result = compute_affective_substrate(self.texts, self.agents)
+            affective_result = self._cached(
+                'affective',
+                lambda: compute_affective_substrate(self.texts, self.agents)
+            )
             psi_affective = affective_result.psi_affective
             sentiment_mean = affective_result.sentiment_mean
             sentiment_variance = affective_result.sentiment_variance
             hedging_density = affective_result.hedging_density
-            agent_sentiment = affective_result.agent_sentiment
-            agent_divergence = compute_agent_affective_divergence(affective_result)
+            if affective_result.agent_sentiment is not None:
+                agent_sentiment = dict(affective_result.agent_sentiment)
+            agent_divergence = self._cached(
+                'affective_divergence',
+                lambda: compute_agent_affective_divergence(affective_result)
+            )
 
         # Trajectory dynamics
-        trajectory_summary = self.trajectory.get_summary()
+        trajectory_summary = self._cached('trajectory', self.trajectory.get_summary)
         trajectory_path_length = trajectory_summary['path_length']
         trajectory_displacement = trajectory_summary['displacement']
         trajectory_tortuosity = trajectory_summary['tortuosity']
 
         # Compute mean velocity from turn states
-        velocities = [s.velocity_magnitude for s in self.turn_states if s.velocity_magnitude is not None]
-        trajectory_mean_velocity = float(np.mean(velocities)) if velocities else None
+        velocities = self.states.column('velocity_magnitude')
+        trajectory_mean_velocity = (
+            float(np.nanmean(velocities)) if np.any(~np.isnan(velocities)) else None
+        )
 
         # Trajectory integrity
-        integrity_result = self.integrity_analyzer.compute(self.trajectory, self.history)
-        transformation_density = self.transformation_detector.compute_transformation_density(
-            self.trajectory, self.history
+        integrity_result = self._cached(
+            'integrity',
+            lambda: self.integrity_analyzer.compute(self.trajectory, self.history)
+        )
+        transformation_density = self._cached(
+            'transformation_density',
+            lambda: self.transformation_detector.compute_transformation_density(
+                self.trajectory, self.history
+            )
         )
 
         # Dialectical analysis
-        challenge_density = compute_challenge_density(self.texts)
-        refuting_question_rate = compute_refuting_question_rate(self.texts)
-        politeness_overhead = compute_politeness_overhead(self.texts)
-        turn_type_dist = compute_turn_type_distribution(self.texts)
+        challenge_density = self._cached(
+            'challenge_density', lambda: compute_challenge_density(self.texts)
+        )
+        refuting_question_rate = self._cached(
+            'refuting_question_rate', lambda: compute_refuting_question_rate(self.texts)
+        )
+        politeness_overhead = self._cached(
+            'politeness_overhead', lambda: compute_politeness_overhead(self.texts)
+        )
+        turn_type_dist = dict(self._cached(
+            'turn_type_distribution', lambda: compute_turn_type_distribution(self.texts)
+        ))
         antithesis_ratio = compute_antithesis_ratio(turn_type_dist)
 
         return SessionAnalysisResult(
@@ -657,7 +1190,7 @@ class SessionAnalyzer:
             inquiry_vs_mimicry_ratio=inquiry_ratio,
             turn_states=self.turn_states,
             n_turns=len(self.texts),
-            agents=list(set(self.agents)),
+            agents=list(self.states.agent_labels),
             # CI fields (populated if compute_ci=True)
             curvature_ci=curvature_ci,
             alpha_ci=alpha_ci,
@@ -699,7 +1232,10 @@ def analyze_session(
     session_path: Path,
     compute_embeddings: bool = True,
     compute_ci: bool = False,
-    bootstrap_iterations: int = 300
+    bootstrap_iterations: int = 300,
+    n_bootstrap_jobs: int = 1,
+    prefix_cache: Optional[PrefixCache] = None,
+    streaming: bool = False
 ) -> SessionAnalysisResult:
     """
     Analyze a completed session from JSON file.
@@ -711,48 +1247,368 @@ def analyze_session(
         compute_ci: If True, compute bootstrap confidence intervals (slower).
             Recommended for research-grade analysis.
         bootstrap_iterations: Number of bootstrap samples for CI computation.
+        n_bootstrap_jobs: Worker processes for the bootstrap resamples
+            (-1 = all CPUs). Only used with compute_ci; results are the same
+            for any value.
+        prefix_cache: Optional PrefixCache shared across calls, so turns in
+            an opening already analyzed are not recomputed
+        streaming: Parse the file incrementally (ijson) and feed turns to
+            the analyzer as they are read, so inline embeddings are never
+            all held at once. Missing embeddings are computed in batches of
+            64 turns. Results are the same as the default path.
 
     Returns:
         SessionAnalysisResult with full analysis (and CIs if compute_ci=True)
     """
-    with open(session_path) as f:
-        data = json.load(f)
+    if streaming:
+        analyzer = _analyze_session_streaming(session_path, compute_embeddings, prefix_cache)
+        return analyzer.get_summary(
+            compute_ci=compute_ci,
+            bootstrap_iterations=bootstrap_iterations,
+            n_jobs=n_bootstrap_jobs
+        )
 
-    analyzer = SessionAnalyzer()
+    return analyze_sessions(
+        [session_path],
+        compute_embeddings=compute_embeddings,
+        compute_ci=compute_ci,
+        bootstrap_iterations=bootstrap_iterations,
+        n_bootstrap_jobs=n_bootstrap_jobs,
+        prefix_cache=prefix_cache
+    )[0]
 
-    # Lazy-load embedding service only if needed
-    embedding_service = None
 
-    for turn in data.get('turns', []):
-        content = turn.get('content', '')
-        agent_id = turn.get('agent_id', 'unknown')
-        embedding = turn.get('embedding')
+def _open_embeddings_file(
+    session_path: Path,
+    header: Dict[str, Any]
+) -> Optional[Tuple[np.ndarray, Optional[np.ndarray]]]:
+    """
+    Memory-map the separately stored embeddings named in a session header.
 
-        if embedding is not None:
-            embedding = np.array(embedding)
-        elif compute_embeddings and content:
-            # Compute embedding on the fly
-            if embedding_service is None:
-                try:
-                    from .embedding_service import get_embedding_service
-                except ImportError:
-                    from embedding_service import get_embedding_service
-                embedding_service = get_embedding_service()
-            embedding = embedding_service.embed(content)
-
-        analyzer.process_turn(content, agent_id, embedding)
-
-    return analyzer.get_summary(
-        compute_ci=compute_ci,
-        bootstrap_iterations=bootstrap_iterations
+    Returns:
+        (rows, int8 scales or None), or None if the session has no
+        embeddings file on disk
+    """
+    embeddings_file = header.get('embeddings_file')
+    if not embeddings_file:
+        return None
+    embeddings_path = Path(session_path).parent / embeddings_file
+    if not embeddings_path.exists():
+        return None
+
+    matrix = np.load(embeddings_path, mmap_mode='r')
+    scales = None
+    if 'embedding_scales_file' in header:
+        scales = np.load(Path(session_path).parent / header['embedding_scales_file'])
+    return matrix, scales
+
+
+def _file_embedding(matrix: np.ndarray, scales: Optional[np.ndarray], row: int) -> np.ndarray:
+    """One row of an embeddings file, as SessionLogger.load_session decodes it."""
+    embedding = matrix[row]
+    if scales is not None:
+        return embedding.astype(np.float32) * scales[row]
+    if embedding.dtype == np.float16:
+        return embedding.astype(np.float32)
+    return embedding
+
+
+def _load_session_turns(session_path: Path) -> List[dict]:
+    """
+    Read a session JSON file (or NDJSON checkpoint log) and return its turns.
+
+    Embeddings kept in a separate .npy file (SessionLogger with
+    embed_inline=False) are memory-mapped and attached to their turns as
+    row views, so float32 files are read without a decode or copy.
+    Reduced-precision files are converted to float32 per row, as
+    SessionLogger.load_session does.
+    """
+    data = load_checkpoint(session_path)
+    turns = data.get('turns', [])
+
+    stored = _open_embeddings_file(session_path, data)
+    if stored is None:
+        return turns
+    matrix, scales = stored
+
+    # Rows follow the turns logged with an embedding; files written before
+    # embedding_hash existed are only used when there is one row per turn
+    targets = [turn for turn in turns if turn.get('embedding_hash') is not None]
+    if not targets:
+        if len(matrix) != len(turns):
+            return turns
+        targets = turns
+
+    for row, turn in enumerate(targets[:len(matrix)]):
+        turn['embedding'] = _file_embedding(matrix, scales, row)
+    return turns
+
+
+def _has_sibling_embeddings(session_path: Path, header: Dict[str, Any]) -> bool:
+    """Whether SessionLogger's embeddings file for this session sits beside it."""
+    session_id = header.get('session_id')
+    if not session_id:
+        return False
+    return (Path(session_path).parent / f"session_{session_id}_embeddings.npy").exists()
+
+
+# Turns embedded together when streaming a session that lacks embeddings
+_STREAM_EMBED_BATCH = 64
+
+
+def _analyze_session_streaming(
+    session_path: Path,
+    compute_embeddings: bool,
+    prefix_cache: Optional[PrefixCache]
+) -> SessionAnalyzer:
+    """
+    Feed a session file through a SessionAnalyzer one turn at a time.
+
+    Turns come from iter_session(), so only the current turn (plus up to
+    _STREAM_EMBED_BATCH turns waiting for embeddings) is held in memory
+    besides the analyzer's own state. Session JSON that names its
+    embeddings file after the turn list (written before the field moved
+    ahead of it) is loaded whole, as the default path does, so its stored
+    vectors are still used.
+
+    Returns:
+        The analyzer after the last turn
+    """
+    analyzer = SessionAnalyzer(prefix_cache=prefix_cache)
+    stored = None
+    by_hash = True
+    row = 0
+    pending: List[dict] = []
+
+    def flush() -> None:
+        computed = _embed_missing_turns([pending])[0]
+        for i, turn in enumerate(pending):
+            analyzer.process_turn(
+                turn.get('content', ''), turn.get('agent_id', 'unknown'), computed.get(i)
+            )
+        pending.clear()
+
+    def feed(record: dict) -> None:
+        nonlocal row
+        embedding_hash = record.get('embedding_hash')
+        if stored is not None and record.get('embedding') is None and (
+            embedding_hash is not None or not by_hash
+        ):
+            if row < len(stored[0]):
+                record['embedding'] = _file_embedding(*stored, row)
+            row += 1
+        embedding = decode_embedding(record, analyzer.embedding_dtype)
+
+        if embedding is None and compute_embeddings and record.get('content', ''):
+            pending.append(record)
+            if len(pending) >= _STREAM_EMBED_BATCH:
+                flush()
+            return
+        if pending:
+            flush()
+        analyzer.process_turn(
+            record.get('content', ''), record.get('agent_id', 'unknown'),
+            embedding, embedding_hash if embedding is not None else None
+        )
+
+    for kind, record in iter_session(session_path):
+        if kind == 'turn':
+            feed(record)
+            continue
+
+        stored = _open_embeddings_file(session_path, record)
+        if stored is None and _has_sibling_embeddings(session_path, record):
+            # Older session JSON names its embeddings file after the turn
+            # list; turns there carry no vectors, so load them whole
+            for turn in _load_session_turns(session_path):
+                feed(turn)
+            break
+        # Without embedding_hash, rows map one-to-one onto turns
+        if stored is not None and record.get('n_turns') == len(stored[0]):
+            by_hash = False
+
+    if pending:
+        flush()
+    return analyzer
+
+
+def _embed_missing_turns(sessions: List[List[dict]]) -> List[Dict[int, np.ndarray]]:
+    """
+    Embed every turn lacking a stored embedding, across all sessions, in
+    one batched pass.
+
+    Args:
+        sessions: Turn lists, one per session
+
+    Returns:
+        Per session, a dict of turn index -> computed embedding
+    """
+    missing = [
+        (k, i)
+        for k, turns in enumerate(sessions)
+        for i, turn in enumerate(turns)
+        if turn.get('embedding') is None and turn.get('embedding_b64') is None
+        and turn.get('content', '')
+    ]
+    computed: List[Dict[int, np.ndarray]] = [{} for _ in sessions]
+    if not missing:
+        return computed
+
+    # Lazy-load embedding service only if needed
+    try:
+        from .embedding_service import get_embedding_service
+    except ImportError:
+        from embedding_service import get_embedding_service
+    vectors = get_embedding_service().embed_batch(
+        [sessions[k][i]['content'] for k, i in missing],
+        batch_size=64
     )
+    for (k, i), vector in zip(missing, vectors):
+        computed[k][i] = vector
+    return computed
+
+
+def analyze_sessions(
+    session_paths: List[Path],
+    compute_embeddings: bool = True,
+    compute_ci: bool = False,
+    bootstrap_iterations: int = 300,
+    n_bootstrap_jobs: int = 1,
+    prefix_cache: Optional[PrefixCache] = None
+) -> List[SessionAnalysisResult]:
+    """
+    Analyze several completed sessions in one pass.
+
+    Session files are read concurrently, turns lacking embeddings are
+    embedded in a single batch across all sessions, and the analyses share
+    one PrefixCache so common openings are computed once. Each result is
+    the same as analyze_session() on that file.
+
+    Args:
+        session_paths: Paths to session JSON files
+        compute_embeddings: Compute embeddings for turns that lack them
+        compute_ci: Compute bootstrap confidence intervals (slower)
+        bootstrap_iterations: Number of bootstrap samples for CI computation
+        n_bootstrap_jobs: Worker processes for each session's bootstrap
+        prefix_cache: PrefixCache to use; a new one is shared across these
+            sessions if not given
+
+    Returns:
+        List of SessionAnalysisResult, in the order of session_paths
+    """
+    session_paths = list(session_paths)
+    if len(session_paths) > 1:
+        # File reads and orjson parsing release the GIL for most of the work
+        max_workers = min(len(session_paths), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            sessions = list(executor.map(_load_session_turns, session_paths))
+        if prefix_cache is None:
+            prefix_cache = PrefixCache()
+    else:
+        sessions = [_load_session_turns(path) for path in session_paths]
+
+    if compute_embeddings:
+        computed = _embed_missing_turns(sessions)
+    else:
+        computed = [{} for _ in sessions]
+
+    results = []
+    for turns, session_computed in zip(sessions, computed):
+        analyzer = SessionAnalyzer(prefix_cache=prefix_cache)
+        for i, turn in enumerate(turns):
+            content = turn.get('content', '')
+            agent_id = turn.get('agent_id', 'unknown')
+            embedding = decode_embedding(turn, analyzer.embedding_dtype)
+            embedding_hash = turn.get('embedding_hash')
+            if embedding is None:
+                embedding = session_computed.get(i)
+                embedding_hash = None
+
+            analyzer.process_turn(content, agent_id, embedding, embedding_hash)
+
+        results.append(analyzer.get_summary(
+            compute_ci=compute_ci,
+            bootstrap_iterations=bootstrap_iterations,
+            n_jobs=n_bootstrap_jobs
+        ))
+
+    return results
+
+
+def _limit_worker_threads() -> None:
+    """Process pool initializer: one BLAS/OpenMP thread per worker."""
+    for var in ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS'):
+        os.environ[var] = '1'
+    if THREADPOOLCTL_AVAILABLE:
+        # Forked workers inherit already-initialized BLAS pools
+        threadpool_limits(limits=1)
+
+
+def analyze_sessions_parallel(
+    session_paths: List[Path],
+    n_jobs: int = -1,
+    compute_embeddings: bool = True,
+    compute_ci: bool = False,
+    bootstrap_iterations: int = 300
+) -> List[SessionAnalysisResult]:
+    """
+    Analyze many sessions across worker processes.
+
+    Paths are split into contiguous chunks, one per worker, and each chunk
+    goes through analyze_sessions(), so sessions in a chunk still share an
+    embedding batch and a PrefixCache. Workers are limited to one BLAS
+    thread each to avoid oversubscribing the CPUs. Per-session work is
+    already vectorized; this adds parallelism across sessions. Results are
+    the same as analyze_session() on each file.
+
+    Args:
+        session_paths: Paths to session JSON files
+        n_jobs: Worker processes (1 runs inline, -1 uses all CPUs). Each
+            worker loads its own embedding model if embeddings are missing.
+        compute_embeddings: Compute embeddings for turns that lack them
+        compute_ci: Compute bootstrap confidence intervals (slower)
+        bootstrap_iterations: Number of bootstrap samples for CI computation
+
+    Returns:
+        List of SessionAnalysisResult, in the order of session_paths
+    """
+    session_paths = list(session_paths)
+    n_jobs = min(_resolve_n_jobs(n_jobs), len(session_paths))
+    if n_jobs <= 1:
+        return analyze_sessions(
+            session_paths,
+            compute_embeddings=compute_embeddings,
+            compute_ci=compute_ci,
+            bootstrap_iterations=bootstrap_iterations
+        )
+
+    bounds = np.linspace(0, len(session_paths), n_jobs + 1).astype(int)
+    chunks = [session_paths[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:])]
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=_limit_worker_threads) as executor:
+        futures = [
+            executor.submit(
+                analyze_sessions, chunk,
+                compute_embeddings=compute_embeddings,
+                compute_ci=compute_ci,
+                bootstrap_iterations=bootstrap_iterations
+            )
+            for chunk in chunks
+        ]
+        return [result for future in futures for result in future.result()]
+
+
+def _ci_overlap(ci_a: Tuple[float, float], ci_b: Tuple[float, float]) -> bool:
+    """Check if two CIs overlap (if they don't, difference may be significant)."""
+    return not (ci_a[1] < ci_b[0] or ci_b[1] < ci_a[0])
 
 
 def compare_sessions(
     session_a_path: Path,
     session_b_path: Path,
     compute_ci: bool = False,
-    bootstrap_iterations: int = 300
+    bootstrap_iterations: int = 300,
+    parallel: bool = True,
+    n_bootstrap_jobs: int = 1
 ) -> Dict[str, Any]:
     """
     Compare two sessions for experimental analysis.
@@ -762,20 +1618,39 @@ def compare_sessions(
         session_b_path: Path to second session
         compute_ci: If True, compute bootstrap CIs and check for overlap
         bootstrap_iterations: Number of bootstrap samples
+        parallel: Analyze the two sessions in separate worker processes.
+            Set False when already running inside a process pool. Each
+            worker loads its own embedding model if embeddings are missing.
+            When False both are analyzed with analyze_sessions(), sharing
+            one embedding batch and one PrefixCache.
+        n_bootstrap_jobs: Worker processes for each session's bootstrap
+            (see analyze_session)
 
     Returns:
         Dict with comparison metrics, deltas, and (if compute_ci) CI overlap analysis
     """
-    result_a = analyze_session(
-        session_a_path,
-        compute_ci=compute_ci,
-        bootstrap_iterations=bootstrap_iterations
-    )
-    result_b = analyze_session(
-        session_b_path,
-        compute_ci=compute_ci,
-        bootstrap_iterations=bootstrap_iterations
-    )
+    if parallel:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            future_a = executor.submit(
+                analyze_session, session_a_path,
+                compute_ci=compute_ci,
+                bootstrap_iterations=bootstrap_iterations,
+                n_bootstrap_jobs=n_bootstrap_jobs
+            )
+            future_b = executor.submit(
+                analyze_session, session_b_path,
+                compute_ci=compute_ci,
+                bootstrap_iterations=bootstrap_iterations,
+                n_bootstrap_jobs=n_bootstrap_jobs
+            )
+            result_a, result_b = future_a.result(), future_b.result()
+    else:
+        result_a, result_b = analyze_sessions(
+            [session_a_path, session_b_path],
+            compute_ci=compute_ci,
+            bootstrap_iterations=bootstrap_iterations,
+            n_bootstrap_jobs=n_bootstrap_jobs
+        )
 
     comparison = {
         'session_a': session_a_path.name,
@@ -802,10 +1677,6 @@ def compare_sessions(
 
     # Add CI overlap analysis if computed
     if compute_ci and result_a.alpha_ci and result_b.alpha_ci:
-        def _ci_overlap(ci_a: Tuple[float, float], ci_b: Tuple[float, float]) -> bool:
-            """Check if two CIs overlap (if they don't, difference may be significant)."""
-            return not (ci_a[1] < ci_b[0] or ci_b[1] < ci_a[0])
-
         comparison['ci_analysis'] = {
             'curvature_ci_a': result_a.curvature_ci,
             'curvature_ci_b': result_b.curvature_ci,
@@ -885,17 +1756,17 @@ if __name__ == "__main__":
         # Synthetic test
         analyzer = SessionAnalyzer()
 
-        # Simulate 10 turns
-        np.random.seed(42)
+        # Simulate 10 turns, embedded up front as one (n_turns, dim) batch
+        rng = np.random.default_rng(42)
         agents = ['ilya', 'elowen', 'orin', 'nyra', 'luma']
+        embeddings = rng.standard_normal((10, 768), dtype=np.float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
 
         for i in range(10):
             agent = agents[i % len(agents)]
             content = f"Turn {i} from {agent}: This is synthetic dialogue content for testing."
-            embedding = np.random.randn(768)
-            embedding /= np.linalg.norm(embedding)
 
-            state = analyzer.process_turn(content, agent, embedding)
+            state = analyzer.process_turn(content, agent, embeddings[i])
             print(f"  Turn {i}: {agent} -> {state.basin} (conf={state.basin_confidence:.2f})")
 
         summary = analyzer.get_summary()
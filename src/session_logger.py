@@ -8,18 +8,358 @@ Licensed under the Earthian Stewardship License (ESL-A).
 See LICENSE file for full terms.
 
 Logs dialogue sessions to JSON with metadata for analysis.
-Supports incremental checkpointing after each turn.
+Supports incremental checkpointing after each turn: turns are appended to
+an NDJSON checkpoint log while the session runs, and the consolidated
+JSON is written once when it ends.
 """
 
+import base64
+import hashlib
 import json
+import os
+import tempfile
+import threading
+import time
 import numpy as np
 from datetime import datetime
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Optional, Any
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Any, Iterable, Iterator, Tuple
 
+# Handle both package and direct execution
+try:
+    from .jsonio import json_dumps, json_loads
+except ImportError:
+    from jsonio import json_dumps, json_loads
 
-@dataclass
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+
+# Session index: one JSON object per line, appended on every checkpoint so
+# listings can be served without scanning the output directory. Readers
+# treat it as current while it is at least as new as the directory itself.
+SESSION_INDEX_NAME = "_index.jsonl"
+_index_lock = threading.Lock()
+
+# Length of the provocation_preview field used by session listings
+PROVOCATION_PREVIEW_CHARS = 100
+
+# Checkpoint file name suffixes: the append-only log written during a
+# session, and the consolidated checkpoint written when it ends
+CHECKPOINT_LOG_SUFFIX = "_checkpoint.ndjson"
+CHECKPOINT_SUFFIX = "_checkpoint.json"
+
+
+def append_session_index(output_dir: Path, entry: Dict[str, Any]) -> None:
+    """
+    Append an entry to the session index in output_dir.
+
+    Entries are partial updates keyed by session_id; when the index is
+    read, later lines for the same session override earlier fields.
+    """
+    line = json.dumps(entry) + "\n"
+    with _index_lock:
+        with open(Path(output_dir) / SESSION_INDEX_NAME, 'a') as f:
+            f.write(line)
+
+
+def _replace_index(path: Path, entries: Iterable[Dict[str, Any]]) -> None:
+    """
+    Rewrite the index at path with one line per entry, via a temp file
+    unique to this writer (other processes may be rewriting it too).
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + "\n")
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def write_session_index(output_dir: Path, entries: Iterable[Dict[str, Any]]) -> None:
+    """Replace the session index with one line per entry (atomic rename)."""
+    with _index_lock:
+        _replace_index(Path(output_dir) / SESSION_INDEX_NAME, entries)
+
+
+def load_session_index(output_dir: Path) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Load the session index, merging entries per session_id.
+
+    The file is compacted in place once superseded lines outnumber
+    the sessions they describe.
+
+    Returns:
+        Dict mapping session_id -> merged entry, or None if no index exists
+    """
+    path = Path(output_dir) / SESSION_INDEX_NAME
+    with _index_lock:
+        try:
+            with open(path) as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return None
+
+        sessions: Dict[str, Dict[str, Any]] = {}
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # Torn trailing line from an interrupted append
+            sessions.setdefault(entry.get("session_id"), {}).update(entry)
+
+        if len(lines) > 2 * len(sessions) + 8:
+            _replace_index(path, sessions.values())
+
+    return sessions
+
+
+def load_checkpoint(path: Path) -> Dict[str, Any]:
+    """
+    Load a session dict from a session JSON file or an NDJSON checkpoint log.
+
+    A checkpoint log is rebuilt into the same shape SessionLogger writes as
+    JSON: the header fields, n_turns, the turn list and the aggregates
+    derived from the turns. A torn trailing line from an interrupted write
+    is skipped.
+
+    Args:
+        path: Path to a .json session/checkpoint or a .ndjson checkpoint log
+
+    Returns:
+        Session data as dict (embeddings are not loaded)
+    """
+    raw = Path(path).read_bytes()
+    if not str(path).endswith(".ndjson"):
+        return json_loads(raw)
+
+    data: Dict[str, Any] = {}
+    turns = []
+    for line in raw.splitlines():
+        try:
+            record = json_loads(line)
+        except ValueError:
+            continue
+        kind = record.pop("_type", "turn")
+        if kind == "header":
+            data.update(record)
+        else:
+            turns.append(record)
+
+    total_tokens = 0
+    agent_turn_counts: Dict[str, int] = {}
+    for turn in turns:
+        if turn.get("prompt_tokens") and turn.get("completion_tokens"):
+            total_tokens += turn["prompt_tokens"] + turn["completion_tokens"]
+        agent_turn_counts[turn["agent_id"]] = agent_turn_counts.get(turn["agent_id"], 0) + 1
+    data["total_latency_ms"] = sum(turn.get("latency_ms", 0.0) for turn in turns)
+    data["total_tokens"] = total_tokens
+    data["agent_turn_counts"] = agent_turn_counts
+    data["n_turns"] = len(turns)
+    data["turns"] = turns
+    return data
+
+
+def iter_session(path: Path) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Stream a session file as ("header", fields) followed by ("turn", turn)
+    for each turn, without holding the whole session in memory.
+
+    NDJSON checkpoint logs are read line by line. Session JSON is parsed
+    incrementally with ijson; the header then holds the top-level scalar
+    fields written ahead of the turn list (session_id, n_turns,
+    embeddings_file, ...). Without ijson the file is loaded whole and the
+    header holds every field except the turns.
+
+    Args:
+        path: Path to a .json session/checkpoint or a .ndjson checkpoint log
+
+    Yields:
+        (kind, record) pairs, the header first
+    """
+    path = Path(path)
+    if str(path).endswith(".ndjson"):
+        header_sent = False
+        with open(path, 'rb') as f:
+            for line in f:
+                try:
+                    record = json_loads(line)
+                except ValueError:
+                    continue  # Torn trailing line from an interrupted append
+                kind = record.pop("_type", "turn")
+                if kind == "header":
+                    header_sent = True
+                    yield "header", record
+                else:
+                    if not header_sent:
+                        header_sent = True
+                        yield "header", {}
+                    yield "turn", record
+        if not header_sent:
+            yield "header", {}
+        return
+
+    if not IJSON_AVAILABLE:
+        data = load_checkpoint(path)
+        turns = data.pop("turns", [])
+        yield "header", data
+        for turn in turns:
+            yield "turn", turn
+        return
+
+    header: Dict[str, Any] = {}
+    header_sent = False
+    builder = None
+    with open(path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if event == 'end_map' and prefix == 'turns.item':
+                    yield "turn", builder.value
+                    builder = None
+            elif event == 'start_map' and prefix == 'turns.item':
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            elif prefix == 'turns' and event == 'start_array':
+                header_sent = True
+                yield "header", header
+            elif not header_sent and '.' not in prefix and event in (
+                'string', 'number', 'boolean', 'null'
+            ):
+                header[prefix] = value
+    if not header_sent:
+        yield "header", header
+
+
+# On-disk embedding precisions accepted by SessionLogger(embed_dtype=...)
+EMBED_DTYPES = ("float32", "float16", "int8")
+
+
+def quantize_embeddings(embeddings: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Quantize embeddings to int8 with one symmetric scale per vector.
+
+    Args:
+        embeddings: Array of shape (n, d)
+
+    Returns:
+        Tuple of (int8 codes of shape (n, d), float32 scales of shape (n,));
+        codes * scale recovers each vector to within scale / 2 per element
+    """
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    peaks = np.abs(embeddings).max(axis=1)
+    scales = np.where(peaks > 0, peaks / 127, 1.0).astype(np.float32)
+    codes = np.round(embeddings / scales[:, None]).astype(np.int8)
+    return codes, scales
+
+
+def decode_embedding(turn: Dict[str, Any], dtype: Optional[type] = None) -> Optional[np.ndarray]:
+    """
+    Decode a turn's stored embedding, if any.
+
+    Accepts either an 'embedding' list of floats or 'embedding_b64', the
+    base64 encoding of the raw vector bytes, which decodes without creating
+    a Python float per element. The bytes are little-endian float32 unless
+    'embedding_dtype' says otherwise; int8 codes are multiplied back by
+    'embedding_scale'.
+
+    Args:
+        turn: Turn dict from a session file
+        dtype: Target dtype (None gives float64 for lists and float32 for
+            binary embeddings)
+
+    Returns:
+        1-D embedding array, or None if the turn has none
+    """
+    encoded = turn.get('embedding_b64')
+    if encoded is not None:
+        embedding = np.frombuffer(
+            base64.b64decode(encoded), dtype=turn.get('embedding_dtype') or '<f4'
+        )
+        embedding = embedding.astype(dtype or np.float32, copy=False)
+        scale = turn.get('embedding_scale')
+        return embedding if scale is None else embedding * embedding.dtype.type(scale)
+
+    embedding = turn.get('embedding')
+    if embedding is None:
+        return None
+    return np.asarray(embedding, dtype=dtype)
+
+
+def embedding_checksum(embedding: np.ndarray, algorithm: Optional[str] = None) -> str:
+    """
+    Checksum of an embedding's float32 values.
+
+    Args:
+        embedding: 1-D embedding vector
+        algorithm: "xxh3_64" or "blake2b_64" (default: xxh3_64 when xxhash
+            is installed)
+
+    Returns:
+        "<algorithm>:<hex digest>"
+    """
+    if algorithm is None:
+        algorithm = "xxh3_64" if XXHASH_AVAILABLE else "blake2b_64"
+    data = np.ascontiguousarray(embedding, dtype='<f4').tobytes()
+    if algorithm == "xxh3_64":
+        digest = xxhash.xxh3_64_hexdigest(data)
+    elif algorithm == "blake2b_64":
+        digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+    else:
+        raise ValueError(f"Unknown checksum algorithm: {algorithm}")
+    return f"{algorithm}:{digest}"
+
+
+def verify_embeddings(data: Dict[str, Any]) -> List[int]:
+    """
+    Check each turn's embedding against its recorded embedding_hash.
+
+    Turns without a hash, without an embedding, or hashed with xxh3 while
+    xxhash is not installed are skipped.
+
+    Args:
+        data: Session dict from SessionLogger.load_session (so embeddings
+            stored in a separate file are already loaded)
+
+    Returns:
+        Turn numbers whose embedding does not match its checksum
+    """
+    embeddings = data.get("embeddings")
+    mismatched = []
+    row = 0
+    for turn in data.get("turns", []):
+        expected = turn.get("embedding_hash")
+        embedding = decode_embedding(turn)
+        if embedding is None and embeddings is not None and expected is not None:
+            embedding = embeddings[row] if row < len(embeddings) else None
+            row += 1
+        if expected is None or embedding is None:
+            continue
+        algorithm = expected.partition(":")[0]
+        if algorithm == "xxh3_64" and not XXHASH_AVAILABLE:
+            continue
+        if embedding_checksum(embedding, algorithm) != expected:
+            mismatched.append(turn.get("turn_number"))
+    return mismatched
+
+
+@dataclass(slots=True)
 class TurnRecord:
     """Record of a single dialogue turn."""
     turn_number: int
@@ -32,10 +372,42 @@ class TurnRecord:
     prompt_tokens: Optional[int] = None
     completion_tokens: Optional[int] = None
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
-    embedding: Optional[List[float]] = None  # Stored inline for small sessions
+    embedding: Optional[np.ndarray] = None  # Stored inline for small sessions
+    # Reduced-precision inline embeddings (embed_dtype float16/int8): base64
+    # of the raw bytes, their numpy dtype string and the int8 scale
+    embedding_b64: Optional[str] = None
+    embedding_dtype: Optional[str] = None
+    embedding_scale: Optional[float] = None
+    # embedding_checksum() of the vector as a reader decodes it
+    embedding_hash: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        data = {
+            "turn_number": self.turn_number,
+            "agent_id": self.agent_id,
+            "agent_name": self.agent_name,
+            "content": self.content,
+            "model": self.model,
+            "temperature": self.temperature,
+            "latency_ms": self.latency_ms,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "timestamp": self.timestamp,
+            "embedding": self.embedding,
+        }
+        # Reduced-precision and checksum fields only when set, so default
+        # turns keep the plain schema
+        if self.embedding_b64 is not None:
+            data["embedding_b64"] = self.embedding_b64
+            data["embedding_dtype"] = self.embedding_dtype
+            if self.embedding_scale is not None:
+                data["embedding_scale"] = self.embedding_scale
+        if self.embedding_hash is not None:
+            data["embedding_hash"] = self.embedding_hash
+        return data
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionRecord:
     """Complete record of a dialogue session."""
     session_id: str
@@ -70,7 +442,9 @@ class SessionLogger:
         self,
         output_dir: Path,
         session_id: Optional[str] = None,
-        embed_inline: bool = True
+        embed_inline: bool = True,
+        write_index: bool = False,
+        embed_dtype: Optional[str] = None
     ):
         """
         Initialize session logger.
@@ -79,15 +453,30 @@ class SessionLogger:
             output_dir: Directory for session output files
             session_id: Optional custom session ID (default: timestamp-based)
             embed_inline: Store embeddings inline in JSON (True) or separate .npy (False)
+            write_index: Append checkpoint metadata to the output_dir session index
+            embed_dtype: On-disk embedding precision: "float32", "float16"
+                (~1e-3 relative error) or "int8" (per-vector scale, ~4x
+                smaller than float32). Inline float16/int8 embeddings are
+                stored as base64 in embedding_b64. None keeps the dtype the
+                embeddings arrive in, as plain inline lists.
         """
+        if embed_dtype is not None and embed_dtype not in EMBED_DTYPES:
+            raise ValueError(f"embed_dtype must be one of {EMBED_DTYPES}, got {embed_dtype!r}")
+
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         self.session_id = session_id or datetime.now().strftime("%Y%m%d_%H%M%S")
         self.embed_inline = embed_inline
+        self.write_index = write_index
+        self.embed_dtype = embed_dtype
 
         self._session: Optional[SessionRecord] = None
-        self._embeddings: List[np.ndarray] = []  # For separate storage
+        self._n_checkpointed = 0  # Turns already appended to the checkpoint log
+        # For separate storage: one (capacity, dim) buffer grown
+        # geometrically; the first _n_emb rows are valid
+        self._emb_buf: Optional[np.ndarray] = None
+        self._n_emb = 0
 
     def start_session(
         self,
@@ -125,7 +514,9 @@ class SessionLogger:
             model_assignments=model_assignments,
             temperature_assignments=temperature_assignments
         )
-        self._embeddings = []
+        self._emb_buf = None
+        self._n_emb = 0
+        self._n_checkpointed = 0
 
         return self._session
 
@@ -165,13 +556,28 @@ class SessionLogger:
 
         turn_number = len(self._session.turns) + 1
 
-        # Handle embedding storage
-        embedding_list = None
+        # Handle embedding storage (inline arrays are encoded by json_dumps)
+        inline_embedding = None
+        encoded = {}
+        embedding_hash = None
         if embedding is not None:
-            if self.embed_inline:
-                embedding_list = embedding.tolist()
+            if self.embed_dtype in (None, "float32"):
+                embedding_hash = embedding_checksum(embedding)
             else:
-                self._embeddings.append(embedding)
+                # Hash the values a reader decodes: the stored dtype widened
+                # to float32, times the int8 scale (as decode_embedding does)
+                stored, scale = self._quantize_embedding(embedding)
+                decoded = stored.astype(np.float32)
+                if scale is not None:
+                    decoded *= np.float32(scale)
+                embedding_hash = embedding_checksum(decoded)
+                if self.embed_inline:
+                    encoded = self._encode_embedding(stored, scale)
+
+            if not self.embed_inline:
+                self._append_embedding(embedding)
+            elif self.embed_dtype in (None, "float32"):
+                inline_embedding = np.array(embedding, dtype=self.embed_dtype)
 
         turn = TurnRecord(
             turn_number=turn_number,
@@ -183,7 +589,9 @@ class SessionLogger:
             latency_ms=latency_ms,
             prompt_tokens=prompt_tokens,
             completion_tokens=completion_tokens,
-            embedding=embedding_list
+            embedding=inline_embedding,
+            embedding_hash=embedding_hash,
+            **encoded
         )
 
         self._session.turns.append(turn)
@@ -214,27 +622,80 @@ class SessionLogger:
         self._session.end_time = datetime.now().isoformat()
 
         # Save final files
-        json_path = self._save_json()
+        json_path = self._save_json(indent=True)
 
-        if not self.embed_inline and self._embeddings:
+        if not self.embed_inline and self._n_emb:
             self._save_embeddings()
 
+        # Replace the checkpoint log with a consolidated checkpoint
+        log_path = self._checkpoint_log_path()
+        if log_path.exists():
+            path = self._save_json(suffix="_checkpoint")
+            log_path.unlink()
+            self._index_checkpoint(path)
+
         return json_path
 
+    def _checkpoint_log_path(self) -> Path:
+        return self.output_dir / f"session_{self.session_id}{CHECKPOINT_LOG_SUFFIX}"
+
     def _save_checkpoint(self):
-        """Save intermediate checkpoint."""
-        self._save_json(suffix="_checkpoint")
+        """
+        Save intermediate checkpoint.
+
+        Appends the turns logged since the last checkpoint to the NDJSON
+        checkpoint log (session fields go in a header line when the log is
+        created), so each checkpoint writes only what is new.
+        """
+        path = self._checkpoint_log_path()
+        turns = self._session.turns
+
+        if self._n_checkpointed == 0:
+            header = self._session_to_dict(include_turns=False)
+            header["_type"] = "header"
+            lines = [json_dumps(header)]
+            mode = 'wb'
+        else:
+            lines = []
+            mode = 'ab'
+
+        for turn in turns[self._n_checkpointed:]:
+            record = turn.to_dict()
+            record["_type"] = "turn"
+            lines.append(json_dumps(record))
+
+        with open(path, mode) as f:
+            f.write(b"\n".join(lines) + b"\n")
+        self._n_checkpointed = len(turns)
+
+        self._index_checkpoint(path)
+
+    def _index_checkpoint(self, path: Path) -> None:
+        """Record the checkpoint in the session index, if enabled."""
+        if self.write_index:
+            append_session_index(self.output_dir, {
+                "session_id": self._session.session_id,
+                "checkpoint": str(path),
+                "provocation": self._session.provocation_text[:PROVOCATION_PREVIEW_CHARS],
+                "n_turns": len(self._session.turns),
+                "start_time": self._session.start_time,
+                "mtime": time.time()
+            })
+
+    def _save_json(self, suffix: str = "", indent: bool = False) -> Path:
+        """
+        Save session to JSON file.
 
-    def _save_json(self, suffix: str = "") -> Path:
-        """Save session to JSON file."""
+        Per-turn checkpoints are written compact; only the final session
+        file is indented.
+        """
         filename = f"session_{self.session_id}{suffix}.json"
         path = self.output_dir / filename
 
         # Convert to dict for JSON serialization
         data = self._session_to_dict()
 
-        with open(path, 'w') as f:
-            json.dump(data, f, indent=2)
+        path.write_bytes(json_dumps(data, indent=indent))
 
         return path
 
@@ -243,17 +704,62 @@ class SessionLogger:
         filename = f"session_{self.session_id}_embeddings.npy"
         path = self.output_dir / filename
 
-        embeddings_array = np.array(self._embeddings)
-        np.save(path, embeddings_array)
+        embeddings = self._emb_buf[:self._n_emb]
+        if self.embed_dtype == "int8":
+            codes, scales = quantize_embeddings(embeddings)
+            np.save(path, codes)
+            np.save(self.output_dir / self._scales_filename(), scales)
+        else:
+            np.save(path, embeddings.astype(self.embed_dtype or embeddings.dtype, copy=False))
 
         return path
 
-    def _session_to_dict(self) -> Dict[str, Any]:
-        """Convert session to JSON-serializable dict."""
+    def _scales_filename(self) -> str:
+        return f"session_{self.session_id}_embedding_scales.npy"
+
+    def _quantize_embedding(self, embedding: np.ndarray) -> Tuple[np.ndarray, Optional[float]]:
+        """An embedding in the float16/int8 storage dtype, with its int8 scale."""
+        if self.embed_dtype == "int8":
+            codes, scales = quantize_embeddings(np.asarray(embedding)[None, :])
+            return codes[0], float(scales[0])
+        return np.asarray(embedding, dtype=self.embed_dtype), None
+
+    @staticmethod
+    def _encode_embedding(stored: np.ndarray, scale: Optional[float]) -> Dict[str, Any]:
+        """TurnRecord fields for a base64 float16/int8 inline embedding."""
+        return {
+            "embedding_b64": base64.b64encode(stored.tobytes()).decode('ascii'),
+            "embedding_dtype": stored.dtype.str,
+            "embedding_scale": scale
+        }
+
+    def _append_embedding(self, embedding: np.ndarray) -> None:
+        """Append one embedding row, doubling the buffer when full."""
+        embedding = np.asarray(embedding)
+        if self._emb_buf is None:
+            self._emb_buf = np.empty((64, embedding.shape[-1]), dtype=embedding.dtype)
+        elif self._n_emb == len(self._emb_buf):
+            grown = np.empty((2 * len(self._emb_buf), self._emb_buf.shape[1]),
+                             dtype=self._emb_buf.dtype)
+            grown[:self._n_emb] = self._emb_buf
+            self._emb_buf = grown
+        self._emb_buf[self._n_emb] = embedding
+        self._n_emb += 1
+
+    def _session_to_dict(self, include_turns: bool = True) -> Dict[str, Any]:
+        """
+        Convert session to JSON-serializable dict.
+
+        Args:
+            include_turns: Include n_turns and the turn list (False gives the
+                checkpoint log header)
+        """
         data = {
             "session_id": self._session.session_id,
             "mode": self._session.mode,
             "provocation_id": self._session.provocation_id,
+            # Truncated copy ahead of the full text for listing readers
+            "provocation_preview": self._session.provocation_text[:PROVOCATION_PREVIEW_CHARS],
             "provocation_text": self._session.provocation_text,
             "seed": self._session.seed,
             "config_path": self._session.config_path,
@@ -264,34 +770,47 @@ class SessionLogger:
             "agent_turn_counts": self._session.agent_turn_counts,
             "model_assignments": self._session.model_assignments,
             "temperature_assignments": self._session.temperature_assignments,
-            "turns": [asdict(turn) for turn in self._session.turns]
         }
-
-        # Add embeddings file reference if stored separately
-        if not self.embed_inline and self._embeddings:
+        # Add embeddings file reference if stored separately (ahead of the
+        # turns, so streaming readers know where to find the vectors)
+        if not self.embed_inline and (self._n_emb or not include_turns):
             data["embeddings_file"] = f"session_{self.session_id}_embeddings.npy"
+            if self.embed_dtype == "int8":
+                data["embedding_scales_file"] = self._scales_filename()
+
+        if include_turns:
+            # Written ahead of turns so readers can stop before the turn list
+            data["n_turns"] = len(self._session.turns)
+            data["turns"] = [turn.to_dict() for turn in self._session.turns]
 
         return data
 
     @staticmethod
     def load_session(path: Path) -> Dict[str, Any]:
         """
-        Load a saved session from JSON.
+        Load a saved session from JSON or an NDJSON checkpoint log.
 
         Args:
-            path: Path to session JSON file
+            path: Path to session JSON file or checkpoint log
 
         Returns:
             Session data as dict
         """
-        with open(path) as f:
-            data = json.load(f)
+        path = Path(path)
+        data = load_checkpoint(path)
 
-        # Load embeddings if stored separately
+        # Load embeddings if stored separately, dequantizing reduced-precision
+        # files to float32
         if "embeddings_file" in data:
             embeddings_path = path.parent / data["embeddings_file"]
             if embeddings_path.exists():
-                data["embeddings"] = np.load(embeddings_path)
+                embeddings = np.load(embeddings_path)
+                if "embedding_scales_file" in data:
+                    scales = np.load(path.parent / data["embedding_scales_file"])
+                    embeddings = embeddings.astype(np.float32) * scales[:, None]
+                elif embeddings.dtype == np.float16:
+                    embeddings = embeddings.astype(np.float32)
+                data["embeddings"] = embeddings
 
         return data
 
@@ -353,3 +872,4 @@ if __name__ == "__main__":
         print(f"Turns: {len(data['turns'])}")
         print(f"Total latency: {data['total_latency_ms']:.0f}ms")
         print(f"Agent turn counts: {data['agent_turn_counts']}")
+        print(f"Embedding checksum mismatches: {verify_embeddings(data)}")
@@ -85,10 +85,17 @@ class TrajectoryBuffer:
     - Path length: Total distance traveled
     - Autocorrelation: Memory measure across lags
 
+    Observations are kept in a preallocated (capacity, 3) float array, one
+    row per point with columns in SUBSTRATES order, so the derivative and
+    geometry methods work on contiguous slices instead of per-point dicts.
+    Missing substrate values are stored as NaN and reported as None.
+
     Attributes:
         window_size: Maximum number of Ψ observations to retain
         timestep: Time interval between observations (default: 1 turn)
-        history: List of (timestamp, psi_vector) tuples
+        psi_array: (n, 3) view of the retained Ψ values, oldest first
+        timestamps: (n,) view of the matching timestamps
+        history: List of (timestamp, psi_vector) tuples (built on access)
     """
 
     # Substrates for MASE (no biosignal)
@@ -104,7 +111,14 @@ class TrajectoryBuffer:
         """
         self.window_size = window_size
         self.timestep = timestep
-        self.history: List[Tuple[float, dict]] = []
+
+        # Twice the window so the live rows only need shifting back to the
+        # front once every window_size appends
+        capacity = 2 * max(window_size, 1)
+        self._psi = np.empty((capacity, len(self.SUBSTRATES)), dtype=np.float64)
+        self._t = np.empty(capacity, dtype=np.float64)
+        self._start = 0
+        self._end = 0
 
     def append(self, psi_vector: dict, timestamp: float = None) -> None:
         """
@@ -114,22 +128,86 @@ class TrajectoryBuffer:
             psi_vector: Dict with psi_semantic, psi_temporal, psi_affective
             timestamp: Optional timestamp (if None, use sequential numbering)
         """
+        values = [psi_vector.get(key) for key in self.SUBSTRATES]
+        self.append_values(
+            *(np.nan if v is None else v for v in values),
+            timestamp=timestamp
+        )
+
+    def append_values(
+        self,
+        psi_semantic: float,
+        psi_temporal: float,
+        psi_affective: float,
+        timestamp: float = None
+    ) -> None:
+        """
+        Add new Ψ observation to buffer without building a dict.
+
+        Args:
+            psi_semantic: Semantic substrate value (NaN if missing)
+            psi_temporal: Temporal substrate value (NaN if missing)
+            psi_affective: Affective substrate value (NaN if missing)
+            timestamp: Optional timestamp (if None, use sequential numbering)
+        """
         if timestamp is None:
-            timestamp = float(len(self.history)) * self.timestep
+            timestamp = float(len(self)) * self.timestep
+
+        if self._end == len(self._t):
+            # Shift the rows still inside the window back to the front
+            keep = self.window_size - 1
+            if keep > 0:
+                self._psi[:keep] = self._psi[self._end - keep:self._end]
+                self._t[:keep] = self._t[self._end - keep:self._end]
+            else:
+                keep = 0
+            self._start = 0
+            self._end = keep
 
-        self.history.append((timestamp, psi_vector))
+        row = self._end
+        self._psi[row, 0] = psi_semantic
+        self._psi[row, 1] = psi_temporal
+        self._psi[row, 2] = psi_affective
+        self._t[row] = timestamp
+        self._end += 1
 
         # Maintain window size
-        if len(self.history) > self.window_size:
-            self.history = self.history[-self.window_size:]
+        if self._end - self._start > self.window_size:
+            self._start = self._end - self.window_size
 
     def clear(self) -> None:
         """Clear all trajectory history."""
-        self.history = []
+        self._start = 0
+        self._end = 0
 
     def __len__(self) -> int:
         """Return number of observations in history."""
-        return len(self.history)
+        return self._end - self._start
+
+    @property
+    def psi_array(self) -> np.ndarray:
+        """(n, 3) view of the retained Ψ values, oldest first."""
+        return self._psi[self._start:self._end]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """(n,) view of the retained timestamps, oldest first."""
+        return self._t[self._start:self._end]
+
+    @property
+    def history(self) -> List[Tuple[float, dict]]:
+        """List of (timestamp, psi_vector) tuples, oldest first."""
+        return [
+            (t, self._row_dict(row))
+            for t, row in zip(self.timestamps.tolist(), self.psi_array.tolist())
+        ]
+
+    def _row_dict(self, row: List[float]) -> dict:
+        """Convert one stored row to a Ψ dict, NaN becoming None."""
+        return {
+            key: None if np.isnan(v) else v
+            for key, v in zip(self.SUBSTRATES, row)
+        }
 
     def compute_velocity(self) -> Optional[dict]:
         """
@@ -144,28 +222,23 @@ class TrajectoryBuffer:
                 'dpsi_affective_dt': float
             } or None if insufficient history
         """
-        if len(self.history) < 3:
+        if len(self) < 3:
             return None
 
         # Central difference: (Ψ[t+1] - Ψ[t-1]) / (2 * dt)
-        t_prev, psi_prev = self.history[-3]
-        t_next, psi_next = self.history[-1]
-        dt = t_next - t_prev
+        t = self.timestamps
+        dt = float(t[-1] - t[-3])
 
         if dt == 0:
             return None
 
-        velocity = {}
-        for key in self.SUBSTRATES:
-            prev_val = psi_prev.get(key)
-            next_val = psi_next.get(key)
-
-            if prev_val is not None and next_val is not None:
-                velocity[f'd{key}_dt'] = (next_val - prev_val) / dt
-            else:
-                velocity[f'd{key}_dt'] = None
+        psi = self.psi_array
+        values = ((psi[-1] - psi[-3]) / dt).tolist()
 
-        return velocity
+        return {
+            f'd{key}_dt': None if np.isnan(v) else v
+            for key, v in zip(self.SUBSTRATES, values)
+        }
 
     def compute_acceleration(self) -> Optional[dict]:
         """
@@ -180,31 +253,23 @@ class TrajectoryBuffer:
                 'd2psi_affective_dt2': float
             } or None if insufficient history
         """
-        if len(self.history) < 3:
+        if len(self) < 3:
             return None
 
         # Second derivative: (Ψ[t+1] - 2*Ψ[t] + Ψ[t-1]) / dt²
-        t_prev, psi_prev = self.history[-3]
-        t_curr, psi_curr = self.history[-2]
-        t_next, psi_next = self.history[-1]
-
-        dt = (t_next - t_prev) / 2  # Average timestep
+        t = self.timestamps
+        dt = float(t[-1] - t[-3]) / 2  # Average timestep
 
         if dt == 0:
             return None
 
-        acceleration = {}
-        for key in self.SUBSTRATES:
-            prev_val = psi_prev.get(key)
-            curr_val = psi_curr.get(key)
-            next_val = psi_next.get(key)
+        psi = self.psi_array
+        values = ((psi[-1] - 2 * psi[-2] + psi[-3]) / (dt ** 2)).tolist()
 
-            if all(v is not None for v in [prev_val, curr_val, next_val]):
-                acceleration[f'd2{key}_dt2'] = (next_val - 2*curr_val + prev_val) / (dt ** 2)
-            else:
-                acceleration[f'd2{key}_dt2'] = None
-
-        return acceleration
+        return {
+            f'd2{key}_dt2': None if np.isnan(v) else v
+            for key, v in zip(self.SUBSTRATES, values)
+        }
 
     def compute_curvature(self) -> Optional[float]:
         """
@@ -254,7 +319,7 @@ class TrajectoryBuffer:
         Returns:
             float: Tortuosity value >= 1.0, or None if insufficient history
         """
-        if len(self.history) < 2:
+        if len(self) < 2:
             return None
 
         path_length = self.compute_path_length()
@@ -276,31 +341,18 @@ class TrajectoryBuffer:
         Returns:
             float: Displacement distance, or None if insufficient history
         """
-        if len(self.history) < 2:
+        if len(self) < 2:
             return None
 
-        _, psi_start = self.history[0]
-        _, psi_end = self.history[-1]
-
-        # Extract numeric values
-        start_vals = []
-        end_vals = []
+        psi = self.psi_array
+        diff = psi[-1] - psi[0]
 
-        for key in self.SUBSTRATES:
-            start_v = psi_start.get(key)
-            end_v = psi_end.get(key)
-
-            if start_v is not None and end_v is not None:
-                start_vals.append(start_v)
-                end_vals.append(end_v)
-
-        if not start_vals:
+        # Only substrates present at both ends
+        valid = ~np.isnan(diff)
+        if not valid.any():
             return None
 
-        start_arr = np.array(start_vals)
-        end_arr = np.array(end_vals)
-
-        return float(np.linalg.norm(end_arr - start_arr))
+        return float(np.linalg.norm(diff[valid]))
 
     def compute_path_length(self) -> Optional[float]:
         """
@@ -309,33 +361,15 @@ class TrajectoryBuffer:
         Returns:
             float: Total path length, or None if insufficient history
         """
-        if len(self.history) < 2:
+        if len(self) < 2:
             return None
 
-        total_length = 0.0
-
-        for i in range(1, len(self.history)):
-            _, psi_prev = self.history[i - 1]
-            _, psi_curr = self.history[i]
+        steps = np.diff(self.psi_array, axis=0)
 
-            # Extract numeric values
-            prev_vals = []
-            curr_vals = []
+        # Substrates missing at either end of a step are left out of it
+        step_lengths = np.sqrt(np.nansum(steps * steps, axis=1))
 
-            for key in self.SUBSTRATES:
-                prev_v = psi_prev.get(key)
-                curr_v = psi_curr.get(key)
-
-                if prev_v is not None and curr_v is not None:
-                    prev_vals.append(prev_v)
-                    curr_vals.append(curr_v)
-
-            if prev_vals:
-                prev_arr = np.array(prev_vals)
-                curr_arr = np.array(curr_vals)
-                total_length += np.linalg.norm(curr_arr - prev_arr)
-
-        return float(total_length)
+        return float(np.sum(step_lengths))
 
     def compute_autocorrelation(self, max_lag: int = 10) -> Optional[List[float]]:
         """
@@ -351,28 +385,25 @@ class TrajectoryBuffer:
             List[float]: Autocorrelation values for lags 1 to max_lag,
                         or None if insufficient history
         """
-        if len(self.history) < 3:
+        if len(self) < 3:
             return None
 
-        # Extract trajectory as array
-        trajectory = []
-        for _, psi in self.history:
-            vals = []
-            for key in self.SUBSTRATES:
-                v = psi.get(key)
-                if v is not None:
-                    vals.append(v)
-            if vals:
-                trajectory.append(vals)
-
-        if len(trajectory) < 3:
+        # Drop points with no substrate values at all
+        trajectory_arr = self.psi_array
+        missing = np.isnan(trajectory_arr)
+        if missing.any():
+            trajectory_arr = trajectory_arr[~missing.all(axis=1)]
+
+        if len(trajectory_arr) < 3:
             return None
 
-        trajectory_arr = np.array(trajectory)
         n_points = len(trajectory_arr)
 
         # Compute composite signal (mean across dimensions)
-        composite = np.mean(trajectory_arr, axis=1)
+        if missing.any():
+            composite = np.nanmean(trajectory_arr, axis=1)
+        else:
+            composite = np.mean(trajectory_arr, axis=1)
 
         # Compute autocorrelation for each lag
         autocorr = []
@@ -399,11 +430,11 @@ class TrajectoryBuffer:
         Returns:
             list: List of (timestamp, psi_vector) tuples or None if empty
         """
-        if len(self.history) == 0:
+        if len(self) == 0:
             return None
 
         if n_points is None:
-            return self.history.copy()
+            return self.history
 
         return self.history[-n_points:]
 
@@ -422,30 +453,21 @@ class TrajectoryBuffer:
                 'speed': float (magnitude / timestep)
             } or None if insufficient history
         """
-        if len(self.history) < 2:
+        if len(self) < 2:
             return None
 
-        _, psi_prev = self.history[-2]
-        _, psi_curr = self.history[-1]
-
         # Compute difference vector
-        diff = {}
-        diff_vals = []
-        for key in self.SUBSTRATES:
-            prev_val = psi_prev.get(key)
-            curr_val = psi_curr.get(key)
-
-            if prev_val is not None and curr_val is not None:
-                diff[key] = curr_val - prev_val
-                diff_vals.append(diff[key])
-            else:
-                diff[key] = None
+        psi = self.psi_array
+        step = psi[-1] - psi[-2]
+        valid = ~np.isnan(step)
 
-        if not diff_vals:
+        if not valid.any():
             return None
 
+        diff = self._row_dict(step.tolist())
+
         # Compute magnitude
-        magnitude = float(np.linalg.norm(diff_vals))
+        magnitude = float(np.linalg.norm(step[valid]))
 
         # Compute unit direction vector
         direction = {}
@@ -507,7 +529,7 @@ class TrajectoryBuffer:
             dict with velocity, acceleration, curvature, tortuosity, path_length
         """
         return {
-            'n_points': len(self.history),
+            'n_points': len(self),
             'velocity_magnitude': self.compute_velocity_magnitude(),
             'acceleration_magnitude': self.compute_acceleration_magnitude(),
             'curvature': self.compute_curvature(),
@@ -535,7 +557,7 @@ def compute_trajectory_derivatives(trajectory: TrajectoryBuffer) -> dict:
             'direction': dict or None
         }
     """
-    if trajectory is None or len(trajectory.history) == 0:
+    if trajectory is None or len(trajectory) == 0:
         return {
             'velocity': None,
             'acceleration': None,
@@ -0,0 +1,51 @@
+"""Tests for session file analysis (src/session_analysis.py)."""
+
+import numpy as np
+
+from src.jsonio import json_dumps
+from src.session_analysis import SessionAnalyzer, analyze_session
+
+AGENTS = ['ilya', 'elowen', 'orin', 'nyra', 'luma']
+
+
+def _synthetic_turns(n_turns: int = 10, dim: int = 64):
+    rng = np.random.default_rng(42)
+    embeddings = rng.standard_normal((n_turns, dim), dtype=np.float32)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    turns = [
+        {
+            "turn_number": i + 1,
+            "agent_id": AGENTS[i % len(AGENTS)],
+            "content": f"Turn {i} from {AGENTS[i % len(AGENTS)]}: perhaps we could ask why?",
+        }
+        for i in range(n_turns)
+    ]
+    return turns, embeddings
+
+
+def test_streaming_uses_embeddings_file_named_after_turns(tmp_path):
+    """
+    Session JSON written before embeddings_file moved ahead of the turn
+    list: streaming must still find the .npy instead of re-embedding.
+    """
+    turns, embeddings = _synthetic_turns()
+    np.save(tmp_path / "session_legacy_embeddings.npy", embeddings)
+    session_file = tmp_path / "session_legacy.json"
+    session_file.write_bytes(json_dumps({
+        "session_id": "legacy",
+        "turns": turns,
+        "embeddings_file": "session_legacy_embeddings.npy",
+    }))
+
+    analyzer = SessionAnalyzer()
+    for turn, embedding in zip(turns, embeddings):
+        analyzer.process_turn(turn["content"], turn["agent_id"], embedding)
+    expected = analyzer.get_summary().to_dict()
+
+    # compute_embeddings stays on: the stored vectors must be found without
+    # falling back to the embedding model
+    loaded = analyze_session(session_file)
+    streamed = analyze_session(session_file, streaming=True)
+
+    assert loaded.to_dict() == expected
+    assert streamed.to_dict() == expected